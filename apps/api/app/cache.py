@@ -0,0 +1,132 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any, Protocol
+
+
+class TTLCache:
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = max(1, maxsize)
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    self._remove(key)
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._store(key, value, expires_at)
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"size": len(self._data), "hits": self.hits, "misses": self.misses}
+
+    def _store(self, key: Hashable, value: Any, expires_at: float, size: int = 0) -> None:
+        self._remove(key)
+        self._data[key] = (expires_at, value, size)
+        while self._over_capacity():
+            self._remove(next(iter(self._data)))
+
+    def _over_capacity(self) -> bool:
+        return len(self._data) > self.maxsize
+
+    def _remove(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+
+class CacheBackend(Protocol):
+    def get(self, key: Hashable) -> Any: ...
+
+    def set(self, key: Hashable, value: Any, loaded_at: float | None = None) -> None: ...
+
+    def delete(self, key: Hashable) -> None: ...
+
+    def clear(self) -> None: ...
+
+    def stats(self) -> dict[str, int]: ...
+
+
+def estimate_size(value: Any) -> int:
+    if isinstance(value, str):
+        return 56 + len(value.encode("utf-8"))
+    if isinstance(value, bytes):
+        return 40 + len(value)
+    if isinstance(value, dict):
+        return 64 + sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    if isinstance(value, list | tuple):
+        return 56 + sum(estimate_size(item) for item in value)
+    return 32
+
+
+class MemoryLRUCache(TTLCache):
+    def __init__(self, max_entries: int, max_bytes: int, ttl: float) -> None:
+        super().__init__(max_entries, ttl)
+        self.max_bytes = max(1, max_bytes)
+        self._bytes = 0
+        self._invalidated_at: OrderedDict[Hashable, float] = OrderedDict()
+        self._cleared_at = float("-inf")
+
+    def set(self, key: Hashable, value: Any, loaded_at: float | None = None, ttl: float | None = None) -> None:
+        size = estimate_size(value)
+        if size > self.max_bytes:
+            return
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            if loaded_at is not None and loaded_at < max(self._cleared_at, self._invalidated_at.get(key, self._cleared_at)):
+                return
+            self._store(key, value, expires_at, size)
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._remove(key)
+            self._invalidated_at[key] = time.monotonic()
+            self._invalidated_at.move_to_end(key)
+            while len(self._invalidated_at) > self.maxsize:
+                self._invalidated_at.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+            self._invalidated_at.clear()
+            self._cleared_at = time.monotonic()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"size": len(self._data), "bytes": self._bytes, "hits": self.hits, "misses": self.misses}
+
+    def _store(self, key: Hashable, value: Any, expires_at: float, size: int = 0) -> None:
+        self._remove(key)
+        self._bytes += size
+        super()._store(key, value, expires_at, size)
+
+    def _over_capacity(self) -> bool:
+        return super()._over_capacity() or self._bytes > self.max_bytes
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._data.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[2]
@@ -1,15 +1,22 @@
-from fastapi import Depends, Header, HTTPException
-import psycopg
+from fastapi import Header, HTTPException
 
-from app.db import get_db
+from app.db import get_connection
 from app.security import decode_access_token
-from app.services.auth_service import get_user_by_id
+from app.services.auth_service import get_user_by_id, user_cache
 
 
-def get_current_user(
-    authorization: str | None = Header(default=None),
-    conn: psycopg.Connection = Depends(get_db),
-) -> dict:
+def load_user(user_id: int) -> dict | None:
+    user = user_cache.get(user_id)
+    if user is None:
+        with get_connection() as conn:
+            user = get_user_by_id(conn, user_id)
+        if not user:
+            return None
+        user_cache.set(user_id, user)
+    return dict(user)
+
+
+def get_current_user(authorization: str | None = Header(default=None)) -> dict:
     if not authorization or not authorization.startswith("Bearer "):
         raise HTTPException(status_code=401, detail="인증 토큰이 필요합니다.")
 
@@ -19,7 +26,7 @@ def get_current_user(
     except ValueError as exc:
         raise HTTPException(status_code=401, detail=str(exc)) from exc
 
-    user = get_user_by_id(conn, int(payload["sub"]))
+    user = load_user(int(payload["sub"]))
     if not user:
         raise HTTPException(status_code=401, detail="사용자를 찾을 수 없습니다.")
 
@@ -0,0 +1,14 @@
+import os
+
+import urllib3
+
+AI_HTTP_POOL_SIZE = int(os.getenv("AI_HTTP_POOL_SIZE", "10"))
+AI_HTTP_CONNECT_TIMEOUT_SECONDS = float(os.getenv("AI_HTTP_CONNECT_TIMEOUT_SECONDS", "5"))
+AI_HTTP_READ_TIMEOUT_SECONDS = float(os.getenv("AI_HTTP_READ_TIMEOUT_SECONDS", "15"))
+
+http = urllib3.PoolManager(
+    num_pools=16,
+    maxsize=AI_HTTP_POOL_SIZE,
+    timeout=urllib3.Timeout(connect=AI_HTTP_CONNECT_TIMEOUT_SECONDS, read=AI_HTTP_READ_TIMEOUT_SECONDS),
+    retries=False,
+)
@@ -1,12 +1,14 @@
 import asyncio
 import os
+from typing import Literal
 
-from fastapi import Depends, FastAPI, HTTPException, Query, Response, WebSocket, WebSocketDisconnect
+from fastapi import Depends, FastAPI, Header, HTTPException, Query, Response, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 import psycopg
 
-from app.db import get_connection, get_db, init_db
-from app.deps import get_current_user
+from app.db import check_db, close_pool, get_connection, get_db, get_pool_stats, init_db, open_pool
+from app.deps import get_current_user, load_user
+from app.etag import etag_matches, make_etag
 from app.realtime import activity_log_poller, manager
 from app.schemas import (
     ActivityLogResponse,
@@ -20,13 +22,18 @@ from app.schemas import (
     LoginResponse,
     MeResponse,
     SnsCommentCreateRequest,
+    SnsCommentNode,
+    SnsCommentPageResponse,
     SnsCommentResponse,
     SnsCommentUpdateRequest,
     SnsPostCreateRequest,
+    SnsPostDetailResponse,
+    SnsPostPageResponse,
     SnsPostResponse,
     SnsPostUpdateRequest,
 )
 from app.security import decode_access_token
+from app.serializers import ORJSONResponse, dump_row, dump_rows
 from app.services import ai_model_service, auth_service, bot_service, sns_service
 
 app = FastAPI(title="hams-api", version="0.7.0")
@@ -49,6 +56,7 @@ app.add_middleware(
 
 @app.on_event("startup")
 async def on_startup() -> None:
+    open_pool()
     init_db()
     with get_connection() as conn:
         auth_service.ensure_default_user(conn)
@@ -65,6 +73,8 @@ async def on_shutdown() -> None:
         await app.state.poller_task
     except asyncio.CancelledError:
         pass
+    manager.close()
+    close_pool()
 
 
 @app.get("/health")
@@ -72,6 +82,18 @@ def health() -> dict[str, str]:
     return {"status": "ok", "service": "api"}
 
 
+@app.get("/health/db")
+def health_db() -> dict[str, str]:
+    if not check_db():
+        raise HTTPException(status_code=503, detail="DB 연결에 실패했습니다.")
+    return {"status": "ok", "service": "db"}
+
+
+@app.get("/health/db/stats")
+def health_db_stats(_: dict = Depends(get_current_user)) -> dict[str, int]:
+    return get_pool_stats()
+
+
 @app.post("/auth/login", response_model=LoginResponse)
 def login(payload: LoginRequest, conn: psycopg.Connection = Depends(get_db)) -> LoginResponse:
     try:
@@ -86,13 +108,26 @@ def me(current_user: dict = Depends(get_current_user)) -> MeResponse:
     return MeResponse(**current_user)
 
 
+def _etag_headers(etag: str) -> dict[str, str]:
+    return {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+
+def _not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers=_etag_headers(etag))
+
+
 @app.get("/bots", response_model=list[BotResponse])
 def get_bots(
+    if_none_match: str | None = Header(default=None),
     current_user: dict = Depends(get_current_user),
     conn: psycopg.Connection = Depends(get_db),
-) -> list[BotResponse]:
+) -> ORJSONResponse | Response:
+    etag = make_etag("bots", current_user["id"], bot_service.bots_version(conn, current_user["id"]))
+    if etag_matches(if_none_match, etag):
+        return _not_modified(etag)
+
     rows = bot_service.list_bots(conn, current_user["id"])
-    return [BotResponse(**row) for row in rows]
+    return ORJSONResponse(dump_rows(BotResponse, rows), headers=_etag_headers(etag))
 
 
 @app.post("/ai/models", response_model=AIModelListResponse)
@@ -164,43 +199,119 @@ def get_bot_jobs(
     bot_id: int,
     current_user: dict = Depends(get_current_user),
     conn: psycopg.Connection = Depends(get_db),
-) -> list[BotJobResponse]:
+) -> ORJSONResponse:
     rows = bot_service.list_bot_jobs(conn, bot_id, current_user["id"])
-    return [BotJobResponse(**row) for row in rows]
+    return ORJSONResponse(dump_rows(BotJobResponse, rows))
 
 
 @app.get("/activity-logs", response_model=list[ActivityLogResponse])
 def get_activity_logs(
     limit: int = Query(default=30, ge=1, le=100),
+    if_none_match: str | None = Header(default=None),
     current_user: dict = Depends(get_current_user),
     conn: psycopg.Connection = Depends(get_db),
-) -> list[ActivityLogResponse]:
+) -> ORJSONResponse | Response:
+    etag = make_etag(
+        "activity-logs",
+        current_user["id"],
+        limit,
+        bot_service.activity_logs_version(conn, current_user["id"], limit=limit),
+    )
+    if etag_matches(if_none_match, etag):
+        return _not_modified(etag)
+
     rows = bot_service.list_activity_logs(conn, current_user["id"], limit=limit)
-    return [ActivityLogResponse(**row) for row in rows]
+    return ORJSONResponse(dump_rows(ActivityLogResponse, rows), headers=_etag_headers(etag))
 
 
-@app.get("/sns/posts", response_model=list[SnsPostResponse])
+@app.get("/sns/posts", response_model=SnsPostPageResponse)
 def get_sns_posts(
+    limit: int = Query(default=20, ge=1, le=100),
+    category: Literal["경제", "문화", "연예", "유머"] | None = Query(default=None),
+    before: str | None = Query(default=None),
+    after: str | None = Query(default=None),
+    if_none_match: str | None = Header(default=None),
     current_user: dict = Depends(get_current_user),
     conn: psycopg.Connection = Depends(get_db),
-) -> list[SnsPostResponse]:
-    rows = sns_service.list_public_posts(conn)
-    for row in rows:
+) -> ORJSONResponse | Response:
+    try:
+        version = sns_service.feed_version(conn, limit=limit, category=category, before=before, after=after)
+        etag = make_etag("sns-posts", current_user["id"], limit, category, before, after, version)
+        if etag_matches(if_none_match, etag):
+            return _not_modified(etag)
+        page = sns_service.list_public_posts(conn, limit=limit, category=category, before=before, after=after)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    for row in page["items"]:
         row["can_edit"] = row["user_id"] == current_user["id"]
-    return [SnsPostResponse(**row) for row in rows]
+    return ORJSONResponse(
+        {
+            "items": dump_rows(SnsPostResponse, page["items"]),
+            "next_cursor": page["next_cursor"],
+            "prev_cursor": page["prev_cursor"],
+        },
+        headers=_etag_headers(etag),
+    )
 
 
 @app.get("/sns/posts/{post_id}", response_model=SnsPostResponse)
 def get_sns_post(
     post_id: int,
+    if_none_match: str | None = Header(default=None),
     current_user: dict = Depends(get_current_user),
     conn: psycopg.Connection = Depends(get_db),
-) -> SnsPostResponse:
-    row = sns_service.get_post_by_id(conn, post_id)
+) -> ORJSONResponse | Response:
+    row = sns_service.get_cached_post(conn, post_id)
     if not row:
         raise HTTPException(status_code=404, detail="게시글을 찾을 수 없습니다.")
+
+    etag = make_etag("sns-post", current_user["id"], post_id, row["updated_at"], row["comment_count"], row["bot_name"])
+    if etag_matches(if_none_match, etag):
+        return _not_modified(etag)
+
     row["can_edit"] = row["user_id"] == current_user["id"]
-    return SnsPostResponse(**row)
+    return ORJSONResponse(dump_row(SnsPostResponse, row), headers=_etag_headers(etag))
+
+
+def _comment_node(row: dict, user_id: int) -> dict:
+    row["can_edit"] = row["user_id"] == user_id
+    row["replies"] = [_comment_node(reply, user_id) for reply in row["replies"]]
+    return dump_row(SnsCommentNode, row)
+
+
+@app.get("/sns/posts/{post_id}/detail", response_model=SnsPostDetailResponse)
+def get_sns_post_detail(
+    post_id: int,
+    thread_limit: int = Query(default=20, ge=1, le=50),
+    reply_limit: int = Query(default=5, ge=0, le=50),
+    cursor: str | None = Query(default=None),
+    current_user: dict = Depends(get_current_user),
+    conn: psycopg.Connection = Depends(get_db),
+) -> ORJSONResponse:
+    try:
+        detail = sns_service.get_post_detail(
+            conn,
+            post_id,
+            thread_limit=thread_limit,
+            reply_limit=reply_limit,
+            cursor=cursor,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    if not detail:
+        raise HTTPException(status_code=404, detail="게시글을 찾을 수 없습니다.")
+
+    post = detail["post"]
+    post["can_edit"] = post["user_id"] == current_user["id"]
+    return ORJSONResponse(
+        {
+            "post": dump_row(SnsPostResponse, post),
+            "threads": [_comment_node(row, current_user["id"]) for row in detail["threads"]],
+            "next_cursor": detail["next_cursor"],
+        }
+    )
 
 
 @app.post("/sns/posts", response_model=SnsPostResponse, status_code=201)
@@ -222,12 +333,7 @@ def create_sns_post(
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
-    row["bot_name"] = None
-    row["comment_count"] = 0
     row["can_edit"] = True
-    if row["bot_id"]:
-        bot = bot_service.get_bot(conn, row["bot_id"], current_user["id"])
-        row["bot_name"] = bot["name"] if bot else None
     return SnsPostResponse(**row)
 
 
@@ -246,12 +352,7 @@ def patch_sns_post(
     if not row:
         raise HTTPException(status_code=403, detail="본인이 작성한 게시글만 수정할 수 있습니다.")
 
-    row["bot_name"] = None
-    row["comment_count"] = len(sns_service.list_comments(conn, post_id))
     row["can_edit"] = True
-    if row["bot_id"]:
-        bot = bot_service.get_bot(conn, row["bot_id"], current_user["id"])
-        row["bot_name"] = bot["name"] if bot else None
     return SnsPostResponse(**row)
 
 
@@ -272,14 +373,14 @@ def get_sns_comments(
     post_id: int,
     current_user: dict = Depends(get_current_user),
     conn: psycopg.Connection = Depends(get_db),
-) -> list[SnsCommentResponse]:
-    if not sns_service.get_post_by_id(conn, post_id):
+) -> ORJSONResponse:
+    post = sns_service.get_cached_post(conn, post_id)
+    if not post:
         raise HTTPException(status_code=404, detail="게시글을 찾을 수 없습니다.")
-    rows = sns_service.list_comments(conn, post_id)
+    rows = sns_service.list_cached_comments(conn, post)
     for row in rows:
         row["can_edit"] = row["user_id"] == current_user["id"]
-        row["bot_name"] = row.get("bot_name")
-    return [SnsCommentResponse(**row) for row in rows]
+    return ORJSONResponse(dump_rows(SnsCommentResponse, rows))
 
 
 @app.post("/sns/posts/{post_id}/comments", response_model=SnsCommentResponse, status_code=201)
@@ -303,13 +404,27 @@ def create_sns_comment(
         status_code = 400 if detail in {"유효하지 않은 봇입니다.", "대댓글 대상 댓글을 찾을 수 없습니다."} else 404
         raise HTTPException(status_code=status_code, detail=detail) from exc
     row["can_edit"] = True
-    row["bot_name"] = None
-    if row["bot_id"]:
-        bot = bot_service.get_bot(conn, row["bot_id"], current_user["id"])
-        row["bot_name"] = bot["name"] if bot else None
     return SnsCommentResponse(**row)
 
 
+@app.get("/sns/comments/{comment_id}/replies", response_model=SnsCommentPageResponse)
+def get_sns_comment_replies(
+    comment_id: int,
+    limit: int = Query(default=20, ge=1, le=100),
+    cursor: str | None = Query(default=None),
+    current_user: dict = Depends(get_current_user),
+    conn: psycopg.Connection = Depends(get_db),
+) -> ORJSONResponse:
+    try:
+        page = sns_service.list_thread_replies(conn, comment_id, limit=limit, cursor=cursor)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    for row in page["items"]:
+        row["can_edit"] = row["user_id"] == current_user["id"]
+    return ORJSONResponse({"items": dump_rows(SnsCommentResponse, page["items"]), "next_cursor": page["next_cursor"]})
+
+
 @app.patch("/sns/comments/{comment_id}", response_model=SnsCommentResponse)
 def patch_sns_comment(
     comment_id: int,
@@ -321,10 +436,6 @@ def patch_sns_comment(
     if not row:
         raise HTTPException(status_code=403, detail="본인이 작성한 댓글만 수정할 수 있습니다.")
     row["can_edit"] = True
-    row["bot_name"] = None
-    if row["bot_id"]:
-        bot = bot_service.get_bot(conn, row["bot_id"], current_user["id"])
-        row["bot_name"] = bot["name"] if bot else None
     return SnsCommentResponse(**row)
 
 
@@ -354,17 +465,22 @@ async def ws_activity(websocket: WebSocket) -> None:
         return
 
     user_id = int(payload["sub"])
-    with get_connection() as conn:
-        user = auth_service.get_user_by_id(conn, user_id)
+    user = await manager.run_db(load_user, user_id)
     if not user:
         await websocket.close(code=1008, reason="user not found")
         return
 
-    await manager.connect(user_id, websocket)
+    since_raw = websocket.query_params.get("since_id")
+    since_id = int(since_raw) if since_raw and since_raw.isdigit() else None
+
+    upto_id = await manager.connect(user_id, websocket)
     await websocket.send_json({"type": "connected", "data": {"user_id": user_id}})
+    await manager.open_stream(user_id, websocket, since_id, upto_id)
 
     try:
         while True:
             await websocket.receive_text()
-    except WebSocketDisconnect:
+    except (WebSocketDisconnect, RuntimeError):
+        pass
+    finally:
         await manager.disconnect(user_id, websocket)
@@ -0,0 +1,55 @@
+import argparse
+
+from app.db import close_pool, get_connection, open_pool
+from app.services import bot_service, sns_service
+
+
+def repair_comment_counts(post_id: int | None) -> None:
+    with get_connection() as conn:
+        repaired = sns_service.repair_comment_counts(conn, post_id)
+    print(f"[maintenance] repaired comment_count rows={repaired}", flush=True)
+
+
+def report_job_density(hours: int, job_type: str | None, top: int) -> None:
+    with get_connection() as conn:
+        rows = bot_service.job_density_by_minute(conn, hours, job_type)
+
+    total = sum(row["jobs"] for row in rows)
+    minutes = hours * 60
+    peak = max((row["jobs"] for row in rows), default=0)
+    average = total / minutes if minutes else 0.0
+    print(
+        f"[maintenance] job density hours={hours} job_type={job_type or 'all'} total={total} "
+        f"busy_minutes={len(rows)}/{minutes} avg_per_minute={average:.2f} peak_per_minute={peak} "
+        f"peak_to_avg={(peak / average) if average else 0.0:.1f}",
+        flush=True,
+    )
+    for row in sorted(rows, key=lambda r: r["jobs"], reverse=True)[:top]:
+        print(f"  {row['minute'].isoformat()} jobs={row['jobs']}", flush=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.maintenance")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    repair = commands.add_parser("repair-comment-counts", help="sns_posts.comment_count를 실제 댓글 수로 재계산")
+    repair.add_argument("--post-id", type=int, default=None)
+
+    density = commands.add_parser("job-density", help="앞으로 N시간 동안 분 단위 작업 실행 예정 수")
+    density.add_argument("--hours", type=int, default=24)
+    density.add_argument("--job-type", default=None)
+    density.add_argument("--top", type=int, default=10)
+
+    args = parser.parse_args()
+    open_pool()
+    try:
+        if args.command == "repair-comment-counts":
+            repair_comment_counts(args.post_id)
+        elif args.command == "job-density":
+            report_job_density(args.hours, args.job_type, args.top)
+    finally:
+        close_pool()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,43 +1,243 @@
 import asyncio
 import json
-from collections import defaultdict
+import os
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 
+import psycopg
 from fastapi import WebSocket
+from psycopg_pool import PoolTimeout
 
-from app.db import get_connection
+from app.db import ACTIVITY_LOG_CHANNEL, DATABASE_URL, SNS_POST_CHANNEL, get_connection
+from app.services import sns_service
+
+REALTIME_BATCH_SIZE = 100
+REALTIME_CATCHUP_SECONDS = float(os.getenv("REALTIME_CATCHUP_SECONDS", "30"))
+REALTIME_LISTEN_RETRY_SECONDS = float(os.getenv("REALTIME_LISTEN_RETRY_SECONDS", "5"))
+REALTIME_DB_WORKERS = int(os.getenv("REALTIME_DB_WORKERS", "2"))
+REALTIME_REPLAY_BUFFER_SIZE = int(os.getenv("REALTIME_REPLAY_BUFFER_SIZE", "1000"))
+REALTIME_REPLAY_LIMIT = int(os.getenv("REALTIME_REPLAY_LIMIT", "100"))
+REALTIME_CHECKPOINT_PATH = os.getenv("REALTIME_CHECKPOINT_PATH", "")
+REALTIME_SEND_QUEUE_SIZE = int(os.getenv("REALTIME_SEND_QUEUE_SIZE", "256"))
+REALTIME_SLOW_CONSUMER_POLICY = os.getenv("REALTIME_SLOW_CONSUMER_POLICY", "disconnect")
+REALTIME_GAP_TIMEOUT_SECONDS = float(os.getenv("REALTIME_GAP_TIMEOUT_SECONDS", "60"))
+REALTIME_MAX_GAP_IDS = int(os.getenv("REALTIME_MAX_GAP_IDS", "1000"))
+
+
+def _to_payload(row: dict) -> dict:
+    return {
+        "type": "activity_log",
+        "data": {
+            "id": row["id"],
+            "bot_id": row["bot_id"],
+            "job_id": row["job_id"],
+            "job_type": row["job_type"],
+            "result_status": row["result_status"],
+            "message": row["message"],
+            "executed_at": row["executed_at"].isoformat(),
+        },
+    }
+
+
+class ClientStream:
+    def __init__(self, websocket: WebSocket) -> None:
+        self.websocket = websocket
+        self.pending: deque[str] = deque()
+        self.ready = asyncio.Event()
+        self.writer_task: asyncio.Task | None = None
+
+    def offer(self, message: str) -> bool:
+        if len(self.pending) >= REALTIME_SEND_QUEUE_SIZE:
+            if REALTIME_SLOW_CONSUMER_POLICY != "drop_oldest":
+                return False
+            self.pending.popleft()
+        self.pending.append(message)
+        self.ready.set()
+        return True
+
+    def prepend(self, messages: list[str]) -> None:
+        self.pending.extendleft(reversed(messages))
+        if self.pending:
+            self.ready.set()
 
 
 class RealtimeManager:
     def __init__(self) -> None:
-        self.connections: dict[int, set[WebSocket]] = defaultdict(set)
+        self.connections: dict[int, dict[WebSocket, ClientStream]] = defaultdict(dict)
         self._lock = asyncio.Lock()
         self._last_log_id = 0
+        self._gap_ids: dict[int, float] = {}
+        self._last_sent_id = 0
+        self._replay_buffer: deque[tuple[int, int, str]] = deque(maxlen=max(1, REALTIME_REPLAY_BUFFER_SIZE))
+        self._replay_floor_id = 0
+        self._fetch_lock = asyncio.Lock()
+        self._db_executor = ThreadPoolExecutor(max_workers=max(1, REALTIME_DB_WORKERS), thread_name_prefix="realtime-db")
 
-    async def connect(self, user_id: int, websocket: WebSocket) -> None:
+    async def connect(self, user_id: int, websocket: WebSocket) -> int:
         await websocket.accept()
         async with self._lock:
-            self.connections[user_id].add(websocket)
+            self.connections[user_id][websocket] = ClientStream(websocket)
+            return self._last_sent_id
+
+    async def open_stream(self, user_id: int, websocket: WebSocket, since_id: int | None, upto_id: int) -> None:
+        messages: list[str] = []
+        if since_id is not None and since_id < upto_id:
+            async with self._lock:
+                buffered = None
+                if since_id >= self._replay_floor_id:
+                    buffered = [
+                        message
+                        for uid, log_id, message in self._replay_buffer
+                        if uid == user_id and since_id < log_id <= upto_id
+                    ]
+
+            if buffered is None:
+                rows = await self.run_db(self.fetch_user_logs, user_id, since_id, upto_id)
+                buffered = [json.dumps(_to_payload(row), ensure_ascii=False) for row in rows]
+            messages = buffered[-REALTIME_REPLAY_LIMIT:]
+
+        async with self._lock:
+            stream = self.connections.get(user_id, {}).get(websocket)
+            if not stream:
+                return
+            stream.prepend(messages)
+            stream.writer_task = asyncio.create_task(self._write_loop(user_id, stream))
+
+    async def _write_loop(self, user_id: int, stream: ClientStream) -> None:
+        try:
+            while True:
+                if not stream.pending:
+                    stream.ready.clear()
+                    await stream.ready.wait()
+                    continue
+                await stream.websocket.send_text(stream.pending.popleft())
+        except asyncio.CancelledError:
+            raise
+        except Exception:  # noqa: BLE001
+            await self.disconnect(user_id, stream.websocket)
 
     async def disconnect(self, user_id: int, websocket: WebSocket) -> None:
         async with self._lock:
             clients = self.connections.get(user_id)
             if not clients:
                 return
-            clients.discard(websocket)
+            stream = clients.pop(websocket, None)
             if not clients:
                 self.connections.pop(user_id, None)
 
+        if stream and stream.writer_task and stream.writer_task is not asyncio.current_task():
+            stream.writer_task.cancel()
+
+    async def _evict_slow_consumer(self, user_id: int, websocket: WebSocket) -> None:
+        await self.disconnect(user_id, websocket)
+        try:
+            await websocket.close(code=1013, reason="slow consumer")
+        except Exception:  # noqa: BLE001
+            pass
+
     async def broadcast_activity_log(self, user_id: int, payload: dict) -> None:
+        log_id = payload["data"]["id"]
+        message = json.dumps(payload, ensure_ascii=False)
+        slow_clients: list[WebSocket] = []
         async with self._lock:
-            clients = list(self.connections.get(user_id, set()))
+            for websocket, stream in self.connections.get(user_id, {}).items():
+                if not stream.offer(message):
+                    slow_clients.append(websocket)
+            if len(self._replay_buffer) == self._replay_buffer.maxlen:
+                self._replay_floor_id = self._replay_buffer[0][1]
+            self._replay_buffer.append((user_id, log_id, message))
+            self._last_sent_id = max(self._last_sent_id, log_id)
+
+        for websocket in slow_clients:
+            await self._evict_slow_consumer(user_id, websocket)
+
+    def close(self) -> None:
+        self._db_executor.shutdown(wait=False, cancel_futures=True)
+
+    async def run_db(self, fn, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._db_executor, fn, *args)
+
+    async def start(self) -> None:
+        start_id = await self.run_db(self._load_start_cursor)
+        self._last_log_id = start_id
+        self._last_sent_id = start_id
+        self._replay_floor_id = start_id
 
-        for ws in clients:
+    def _load_start_cursor(self) -> int:
+        if REALTIME_CHECKPOINT_PATH:
             try:
-                await ws.send_text(json.dumps(payload, ensure_ascii=False))
-            except Exception:  # noqa: BLE001
-                await self.disconnect(user_id, ws)
+                with open(REALTIME_CHECKPOINT_PATH, encoding="utf-8") as fp:
+                    return int(fp.read().strip())
+            except (OSError, ValueError):
+                pass
+
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("SELECT COALESCE(MAX(id), 0) AS max_id FROM activity_logs")
+                return cur.fetchone()["max_id"]
+
+    def _save_checkpoint(self, log_id: int) -> None:
+        tmp_path = f"{REALTIME_CHECKPOINT_PATH}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as fp:
+            fp.write(str(log_id))
+        os.replace(tmp_path, REALTIME_CHECKPOINT_PATH)
+
+    async def save_checkpoint(self) -> None:
+        if not REALTIME_CHECKPOINT_PATH:
+            return
+        try:
+            await self.run_db(self._save_checkpoint, self._last_sent_id)
+        except OSError as exc:
+            print(f"[realtime] checkpoint save failed: {exc}", flush=True)
+
+    async def poll_new_logs(self) -> list[dict]:
+        async with self._fetch_lock:
+            return await self.run_db(self.fetch_new_logs)
+
+    def fetch_user_logs(self, user_id: int, since_id: int, upto_id: int) -> list[dict]:
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    """
+                    SELECT l.id, l.bot_id, l.job_id, l.job_type, l.result_status, l.message, l.executed_at
+                    FROM activity_logs l
+                    INNER JOIN bots b ON b.id = l.bot_id
+                    WHERE b.user_id = %s
+                      AND l.id > %s
+                      AND l.id <= %s
+                    ORDER BY l.id DESC
+                    LIMIT %s
+                    """,
+                    (user_id, since_id, upto_id, REALTIME_REPLAY_LIMIT),
+                )
+                rows = list(cur.fetchall())
+        rows.reverse()
+        return rows
+
+    def _track_gaps(self, rows: list[dict], now: float) -> None:
+        expected = self._last_log_id + 1
+        for row in rows:
+            if row["id"] < expected:
+                continue
+            missing = range(max(expected, row["id"] - REALTIME_MAX_GAP_IDS), row["id"])
+            self._gap_ids.update(dict.fromkeys(missing, now))
+            expected = row["id"] + 1
+        self._last_log_id = max(self._last_log_id, expected - 1)
+
+        if len(self._gap_ids) > REALTIME_MAX_GAP_IDS:
+            for log_id in sorted(self._gap_ids)[: len(self._gap_ids) - REALTIME_MAX_GAP_IDS]:
+                del self._gap_ids[log_id]
 
     def fetch_new_logs(self) -> list[dict]:
+        now = time.monotonic()
+        self._gap_ids = {
+            log_id: seen_at
+            for log_id, seen_at in self._gap_ids.items()
+            if now - seen_at < REALTIME_GAP_TIMEOUT_SECONDS
+        }
+
         with get_connection() as conn:
             with conn.cursor() as cur:
                 cur.execute(
@@ -45,39 +245,79 @@ class RealtimeManager:
                     SELECT l.id, b.user_id, l.bot_id, l.job_id, l.job_type, l.result_status, l.message, l.executed_at
                     FROM activity_logs l
                     INNER JOIN bots b ON b.id = l.bot_id
-                    WHERE l.id > %s
-                    ORDER BY l.id ASC
-                    LIMIT 100
+                    WHERE l.id = ANY(%(gap_ids)s)
+                    UNION ALL
+                    (
+                        SELECT l.id, b.user_id, l.bot_id, l.job_id, l.job_type, l.result_status, l.message, l.executed_at
+                        FROM activity_logs l
+                        INNER JOIN bots b ON b.id = l.bot_id
+                        WHERE l.id > %(after_id)s
+                        ORDER BY l.id ASC
+                        LIMIT %(limit)s
+                    )
+                    ORDER BY id ASC
                     """,
-                    (self._last_log_id,),
+                    {"gap_ids": list(self._gap_ids), "after_id": self._last_log_id, "limit": REALTIME_BATCH_SIZE},
                 )
                 rows = list(cur.fetchall())
 
-        if rows:
-            self._last_log_id = rows[-1]["id"]
-
+        for row in rows:
+            self._gap_ids.pop(row["id"], None)
+        self._track_gaps(rows, now)
         return rows
 
 
 manager = RealtimeManager()
 
 
+async def activity_log_listener(wakeup: asyncio.Event) -> None:
+    while True:
+        try:
+            async with await psycopg.AsyncConnection.connect(DATABASE_URL, autocommit=True) as conn:
+                await conn.execute(f"LISTEN {ACTIVITY_LOG_CHANNEL}")
+                await conn.execute(f"LISTEN {SNS_POST_CHANNEL}")
+                sns_service.invalidate_post()
+                wakeup.set()
+                async for notify in conn.notifies():
+                    if notify.channel == SNS_POST_CHANNEL:
+                        sns_service.invalidate_post(None if notify.payload == "*" else int(notify.payload))
+                    else:
+                        wakeup.set()
+        except psycopg.Error as exc:
+            print(f"[realtime] listen connection lost: {exc}", flush=True)
+        await asyncio.sleep(REALTIME_LISTEN_RETRY_SECONDS)
+
+
+async def dispatch_new_logs() -> int:
+    rows = await manager.poll_new_logs()
+    for row in rows:
+        await manager.broadcast_activity_log(row["user_id"], _to_payload(row))
+    if rows:
+        await manager.save_checkpoint()
+    return len(rows)
+
+
 async def activity_log_poller(stop_event: asyncio.Event) -> None:
-    while not stop_event.is_set():
-        rows = manager.fetch_new_logs()
-        for row in rows:
-            payload = {
-                "type": "activity_log",
-                "data": {
-                    "id": row["id"],
-                    "bot_id": row["bot_id"],
-                    "job_id": row["job_id"],
-                    "job_type": row["job_type"],
-                    "result_status": row["result_status"],
-                    "message": row["message"],
-                    "executed_at": row["executed_at"].isoformat(),
-                },
-            }
-            await manager.broadcast_activity_log(row["user_id"], payload)
-
-        await asyncio.sleep(1)
+    wakeup = asyncio.Event()
+    await manager.start()
+    listener_task = asyncio.create_task(activity_log_listener(wakeup))
+    try:
+        while not stop_event.is_set():
+            wakeup.clear()
+            try:
+                while await dispatch_new_logs() >= REALTIME_BATCH_SIZE:
+                    pass
+            except (psycopg.Error, PoolTimeout) as exc:
+                print(f"[realtime] activity log fetch failed: {exc}", flush=True)
+                try:
+                    await asyncio.wait_for(stop_event.wait(), timeout=REALTIME_LISTEN_RETRY_SECONDS)
+                except TimeoutError:
+                    pass
+                continue
+
+            try:
+                await asyncio.wait_for(wakeup.wait(), timeout=REALTIME_CATCHUP_SECONDS)
+            except TimeoutError:
+                pass
+    finally:
+        listener_task.cancel()
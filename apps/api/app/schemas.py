@@ -107,6 +107,12 @@ class SnsPostResponse(BaseModel):
     can_edit: bool = False
 
 
+class SnsPostPageResponse(BaseModel):
+    items: list[SnsPostResponse]
+    next_cursor: str | None = None
+    prev_cursor: str | None = None
+
+
 class SnsCommentCreateRequest(BaseModel):
     content: str = Field(..., min_length=1)
     bot_id: int | None = None
@@ -130,6 +136,24 @@ class SnsCommentResponse(BaseModel):
     can_edit: bool = False
 
 
+class SnsCommentNode(SnsCommentResponse):
+    replies: list["SnsCommentNode"] = Field(default_factory=list)
+    reply_count: int = 0
+    has_more_replies: bool = False
+    next_reply_cursor: str | None = None
+
+
+class SnsPostDetailResponse(BaseModel):
+    post: SnsPostResponse
+    threads: list[SnsCommentNode]
+    next_cursor: str | None = None
+
+
+class SnsCommentPageResponse(BaseModel):
+    items: list[SnsCommentResponse]
+    next_cursor: str | None = None
+
+
 class AIModelListRequest(BaseModel):
     ai_provider: AIProviderType
     api_key: str = Field(..., min_length=1)
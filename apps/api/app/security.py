@@ -5,7 +5,12 @@ import json
 import os
 import time
 
+from app.cache import TTLCache
+
 SECRET_KEY = os.getenv("APP_SECRET_KEY", "change-me")
+TOKEN_CACHE_MAX_SIZE = int(os.getenv("TOKEN_CACHE_MAX_SIZE", "10000"))
+
+token_cache = TTLCache(maxsize=TOKEN_CACHE_MAX_SIZE, ttl=60 * 60 * 24)
 
 
 def hash_password(password: str) -> str:
@@ -29,6 +34,10 @@ def create_access_token(user_id: int, email: str, expires_minutes: int = 60 * 24
 
 
 def decode_access_token(token: str) -> dict:
+    cached = token_cache.get(token)
+    if cached is not None:
+        return cached
+
     try:
         body, signature = token.split(".", 1)
     except ValueError as exc:
@@ -42,7 +51,9 @@ def decode_access_token(token: str) -> dict:
     payload_raw = base64.urlsafe_b64decode(padded_body.encode("utf-8"))
     payload = json.loads(payload_raw.decode("utf-8"))
 
-    if int(payload["exp"]) < int(time.time()):
+    remaining = int(payload["exp"]) - int(time.time())
+    if remaining < 0:
         raise ValueError("token expired")
 
+    token_cache.set(token, payload, ttl=remaining)
     return payload
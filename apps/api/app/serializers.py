@@ -0,0 +1,42 @@
+from collections.abc import Iterable
+from functools import cache
+from typing import Any
+
+from fastapi import responses
+import orjson
+from pydantic import BaseModel
+from pydantic.fields import FieldInfo
+
+
+class ORJSONResponse(responses.ORJSONResponse):
+    """UTC 시각을 pydantic과 같은 `...Z`로 쓰는 ORJSONResponse."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z)
+
+
+@cache
+def _model_fields(model: type[BaseModel]) -> tuple[tuple[str, FieldInfo], ...]:
+    return tuple(model.model_fields.items())
+
+
+def dump_row(model: type[BaseModel], row: dict) -> dict:
+    fields = _model_fields(model)
+    try:
+        return {name: row[name] for name, _ in fields}
+    except KeyError:
+        pass
+
+    data = {}
+    for name, field in fields:
+        if name in row:
+            data[name] = row[name]
+        elif field.is_required():
+            raise KeyError(f"{model.__name__}.{name}")
+        else:
+            data[name] = field.get_default(call_default_factory=True)
+    return data
+
+
+def dump_rows(model: type[BaseModel], rows: Iterable[dict]) -> list[dict]:
+    return [dump_row(model, row) for row in rows]
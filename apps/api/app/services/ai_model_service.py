@@ -1,7 +1,9 @@
 import json
-import urllib.error
 import urllib.parse
-import urllib.request
+
+import urllib3
+
+from app.http_client import http
 
 
 class AIModelServiceError(Exception):
@@ -9,12 +11,16 @@ class AIModelServiceError(Exception):
 
 
 def _request_json(url: str, headers: dict[str, str] | None = None) -> dict:
-    req = urllib.request.Request(url=url, method="GET", headers=headers or {})
     try:
-        with urllib.request.urlopen(req, timeout=15) as resp:
-            return json.loads(resp.read().decode("utf-8"))
-    except urllib.error.URLError as exc:
+        resp = http.request("GET", url, headers=headers or {})
+    except urllib3.exceptions.HTTPError as exc:
         raise AIModelServiceError(f"model list fetch failed: {exc}") from exc
+    if resp.status >= 400:
+        raise AIModelServiceError(f"model list fetch failed: HTTP {resp.status} {resp.reason}")
+    try:
+        return json.loads(resp.data.decode("utf-8"))
+    except ValueError as exc:
+        raise AIModelServiceError("model list fetch failed: invalid JSON") from exc
 
 
 def list_models(ai_provider: str, api_key: str) -> list[str]:
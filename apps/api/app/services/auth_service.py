@@ -2,12 +2,17 @@ import os
 
 import psycopg
 
+from app.cache import TTLCache
 from app.security import create_access_token, hash_password, verify_password
 
 
 DEFAULT_EMAIL = os.getenv("DEFAULT_USER_EMAIL", "owner@hams.local")
 DEFAULT_PASSWORD = os.getenv("DEFAULT_USER_PASSWORD", "hams1234")
 DEFAULT_NICKNAME = os.getenv("DEFAULT_USER_NICKNAME", "owner")
+USER_CACHE_TTL_SECONDS = float(os.getenv("USER_CACHE_TTL_SECONDS", "60"))
+USER_CACHE_MAX_SIZE = int(os.getenv("USER_CACHE_MAX_SIZE", "10000"))
+
+user_cache = TTLCache(maxsize=USER_CACHE_MAX_SIZE, ttl=USER_CACHE_TTL_SECONDS)
 
 
 def ensure_default_user(conn: psycopg.Connection) -> None:
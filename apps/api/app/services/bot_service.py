@@ -1,9 +1,18 @@
 import json
+import os
 
 import psycopg
 
+from app.db import BOT_JOB_CHANNEL
+from app.services import sns_service
+
 POST_JOB_INTERVAL_SECONDS = 86400
 COMMENT_JOB_INTERVAL_SECONDS = 300
+BOT_JOB_SEED_SPREAD_SECONDS = int(os.getenv("BOT_JOB_SEED_SPREAD_SECONDS", "600"))
+
+
+def _notify_bot_jobs(cur: psycopg.Cursor, bot_id: int) -> None:
+    cur.execute("SELECT pg_notify(%s, %s)", (BOT_JOB_CHANNEL, str(bot_id)))
 
 
 def _validate_ai_config(ai_provider: str, api_key: str, ai_model: str) -> None:
@@ -42,6 +51,21 @@ def list_bots(conn: psycopg.Connection, user_id: int) -> list[dict]:
         return list(cur.fetchall())
 
 
+def bots_version(conn: psycopg.Connection, user_id: int) -> str:
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT COUNT(*) AS row_count,
+                   COALESCE(md5(string_agg(concat_ws(':', id, updated_at), ',' ORDER BY id)), '') AS digest
+            FROM bots
+            WHERE user_id = %s
+            """,
+            (user_id,),
+        )
+        row = cur.fetchone()
+    return f"{row['row_count']}:{row['digest']}"
+
+
 def create_bot(
     conn: psycopg.Connection,
     user_id: int,
@@ -84,11 +108,25 @@ def create_bot(
         ]
         cur.executemany(
             """
-            INSERT INTO bot_jobs (bot_id, job_type, payload, interval_seconds)
-            VALUES (%s, %s, %s::jsonb, %s)
+            INSERT INTO bot_jobs (bot_id, user_id, job_type, payload, interval_seconds, next_run_at)
+            VALUES (
+                %(bot_id)s, %(user_id)s, %(job_type)s, %(payload)s::jsonb, %(interval_seconds)s,
+                NOW() + bot_job_slot_seconds(%(bot_id)s, LEAST(%(interval_seconds)s, %(spread)s)) * INTERVAL '1 second'
+            )
             """,
-            seed_jobs,
+            [
+                {
+                    "bot_id": bot_id,
+                    "user_id": user_id,
+                    "job_type": job_type,
+                    "payload": job_payload,
+                    "interval_seconds": interval_seconds,
+                    "spread": BOT_JOB_SEED_SPREAD_SECONDS,
+                }
+                for bot_id, job_type, job_payload, interval_seconds in seed_jobs
+            ],
         )
+        _notify_bot_jobs(cur, bot["id"])
 
     conn.commit()
     return bot
@@ -138,7 +176,11 @@ def update_bot(conn: psycopg.Connection, bot_id: int, user_id: int, payload: dic
             tuple(values),
         )
         bot = cur.fetchone()
+        if bot and payload.get("is_active") is True:
+            _notify_bot_jobs(cur, bot["id"])
     conn.commit()
+    if bot and payload.get("name") is not None:
+        sns_service.invalidate_post()
     return bot
 
 
@@ -211,6 +253,50 @@ def list_bot_jobs(conn: psycopg.Connection, bot_id: int, user_id: int) -> list[d
         return list(cur.fetchall())
 
 
+def job_density_by_minute(conn: psycopg.Connection, hours: int = 24, job_type: str | None = None) -> list[dict]:
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT date_trunc('minute', t.run_at) AS minute, COUNT(*) AS jobs
+            FROM bot_jobs j
+            INNER JOIN bots b ON b.id = j.bot_id
+            CROSS JOIN LATERAL generate_series(
+                j.next_run_at,
+                NOW() + (%s * INTERVAL '1 hour'),
+                GREATEST(j.interval_seconds, 1) * INTERVAL '1 second'
+            ) AS t(run_at)
+            WHERE j.status = 'active'
+              AND b.is_active = TRUE
+              AND (%s::text IS NULL OR j.job_type = %s)
+            GROUP BY 1
+            ORDER BY 1
+            """,
+            (hours, job_type, job_type),
+        )
+        return list(cur.fetchall())
+
+
+def activity_logs_version(conn: psycopg.Connection, user_id: int, limit: int = 30) -> str:
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT COUNT(*) AS row_count,
+                   COALESCE(md5(string_agg(w.id::text, ',' ORDER BY w.id)), '') AS digest
+            FROM (
+                SELECT l.id
+                FROM activity_logs l
+                INNER JOIN bots b ON b.id = l.bot_id
+                WHERE b.user_id = %s
+                ORDER BY l.id DESC
+                LIMIT %s
+            ) w
+            """,
+            (user_id, limit),
+        )
+        row = cur.fetchone()
+    return f"{row['row_count']}:{row['digest']}"
+
+
 def list_activity_logs(conn: psycopg.Connection, user_id: int, limit: int = 30) -> list[dict]:
     with conn.cursor() as cur:
         cur.execute(
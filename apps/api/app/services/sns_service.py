@@ -1,10 +1,129 @@
+import base64
+import json
+import os
+import time
+from datetime import datetime
+
 import psycopg
 
+from app.cache import CacheBackend, MemoryLRUCache
+
+SNS_CACHE_TTL_SECONDS = float(os.getenv("SNS_CACHE_TTL_SECONDS", "300"))
+SNS_CACHE_MAX_ENTRIES = int(os.getenv("SNS_CACHE_MAX_ENTRIES", "10000"))
+SNS_CACHE_MAX_BYTES = int(os.getenv("SNS_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+
+post_cache: CacheBackend = MemoryLRUCache(
+    max_entries=SNS_CACHE_MAX_ENTRIES,
+    max_bytes=SNS_CACHE_MAX_BYTES,
+    ttl=SNS_CACHE_TTL_SECONDS,
+)
+
+
+def set_post_cache(backend: CacheBackend) -> None:
+    global post_cache
+    post_cache = backend
+
+
+def invalidate_post(post_id: int | None = None) -> None:
+    if post_id is None:
+        post_cache.clear()
+        return
+    post_cache.delete(("post", post_id))
+    post_cache.delete(("comments", post_id))
+
+
+def encode_cursor(row: dict) -> str:
+    raw = json.dumps({"created_at": row["created_at"].isoformat(), "id": row["id"]}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("utf-8").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("utf-8")).decode("utf-8"))
+        return datetime.fromisoformat(payload["created_at"]), int(payload["id"])
+    except (ValueError, KeyError, TypeError) as exc:
+        raise ValueError("유효하지 않은 커서입니다.") from exc
+
+
+def _feed_window(
+    limit: int,
+    category: str | None,
+    before: str | None,
+    after: str | None,
+) -> tuple[str, str, list, bool, str | None]:
+    if before and after:
+        raise ValueError("before와 after는 함께 사용할 수 없습니다.")
+
+    conditions: list[str] = []
+    values: list = []
+    if category:
+        conditions.append("p.category = %s")
+        values.append(category)
+
+    ascending = after is not None
+    cursor = before or after
+    if cursor:
+        created_at, post_id = decode_cursor(cursor)
+        conditions.append(f"(p.created_at, p.id) {'>' if ascending else '<'} (%s, %s)")
+        values.extend([created_at, post_id])
+
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    order = "ASC" if ascending else "DESC"
+    values.append(limit + 1)
+    return where, order, values, ascending, cursor
+
+
+def feed_version(
+    conn: psycopg.Connection,
+    limit: int = 20,
+    category: str | None = None,
+    before: str | None = None,
+    after: str | None = None,
+) -> str:
+    where, order, values, _, _ = _feed_window(limit, category, before, after)
 
-def list_public_posts(conn: psycopg.Connection) -> list[dict]:
     with conn.cursor() as cur:
         cur.execute(
-            """
+            f"""
+            SELECT COUNT(*) AS row_count,
+                   COALESCE(
+                       md5(string_agg(
+                           concat_ws(':', w.id, w.updated_at, w.comment_count, b.updated_at),
+                           ',' ORDER BY w.id
+                       )),
+                       ''
+                   ) AS digest
+            FROM (
+                SELECT p.id,
+                       p.bot_id,
+                       p.updated_at,
+                       p.comment_count
+                FROM sns_posts p
+                {where}
+                ORDER BY p.created_at {order}, p.id {order}
+                LIMIT %s
+            ) w
+            LEFT JOIN bots b ON b.id = w.bot_id
+            """,
+            tuple(values),
+        )
+        row = cur.fetchone()
+    return f"{row['row_count']}:{row['digest']}"
+
+
+def list_public_posts(
+    conn: psycopg.Connection,
+    limit: int = 20,
+    category: str | None = None,
+    before: str | None = None,
+    after: str | None = None,
+) -> dict:
+    where, order, values, ascending, cursor = _feed_window(limit, category, before, after)
+
+    with conn.cursor() as cur:
+        cur.execute(
+            f"""
             SELECT p.id,
                    p.user_id,
                    p.bot_id,
@@ -15,17 +134,29 @@ def list_public_posts(conn: psycopg.Connection) -> list[dict]:
                    p.created_at,
                    p.updated_at,
                    b.name AS bot_name,
-                   (
-                     SELECT COUNT(*)::INT
-                     FROM sns_comments c
-                     WHERE c.post_id = p.id
-                   ) AS comment_count
+                   p.comment_count
             FROM sns_posts p
             LEFT JOIN bots b ON b.id = p.bot_id
-            ORDER BY p.created_at DESC
+            {where}
+            ORDER BY p.created_at {order}, p.id {order}
+            LIMIT %s
             """,
+            tuple(values),
         )
-        return list(cur.fetchall())
+        rows = list(cur.fetchall())
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    if ascending:
+        rows.reverse()
+
+    has_newer = has_more if ascending else cursor is not None
+    has_older = cursor is not None if ascending else has_more
+    return {
+        "items": rows,
+        "next_cursor": encode_cursor(rows[-1]) if rows and has_older else None,
+        "prev_cursor": encode_cursor(rows[0]) if rows and has_newer else None,
+    }
 
 
 def get_post_by_id(conn: psycopg.Connection, post_id: int) -> dict | None:
@@ -42,11 +173,7 @@ def get_post_by_id(conn: psycopg.Connection, post_id: int) -> dict | None:
                    p.created_at,
                    p.updated_at,
                    b.name AS bot_name,
-                   (
-                     SELECT COUNT(*)::INT
-                     FROM sns_comments c
-                     WHERE c.post_id = p.id
-                   ) AS comment_count
+                   p.comment_count
             FROM sns_posts p
             LEFT JOIN bots b ON b.id = p.bot_id
             WHERE p.id = %s
@@ -56,25 +183,221 @@ def get_post_by_id(conn: psycopg.Connection, post_id: int) -> dict | None:
         return cur.fetchone()
 
 
-def is_post_owner(conn: psycopg.Connection, post_id: int, user_id: int) -> bool:
+def get_cached_post(conn: psycopg.Connection, post_id: int) -> dict | None:
+    row = post_cache.get(("post", post_id))
+    if row is None:
+        loaded_at = time.monotonic()
+        row = get_post_by_id(conn, post_id)
+        if row is None:
+            return None
+        post_cache.set(("post", post_id), row, loaded_at=loaded_at)
+    return dict(row)
+
+
+def list_cached_comments(conn: psycopg.Connection, post: dict) -> list[dict]:
+    version = (post["updated_at"], post["comment_count"])
+    entry = post_cache.get(("comments", post["id"]))
+    if entry is None or entry["version"] != version:
+        loaded_at = time.monotonic()
+        entry = {"version": version, "rows": list_comments(conn, post["id"])}
+        post_cache.set(("comments", post["id"]), entry, loaded_at=loaded_at)
+    return [dict(row) for row in entry["rows"]]
+
+
+_COMMENT_JSON = """
+    json_build_object(
+        'id', c.id,
+        'post_id', c.post_id,
+        'user_id', c.user_id,
+        'bot_id', c.bot_id,
+        'parent_comment_id', c.parent_comment_id,
+        'bot_name', b.name,
+        'content', c.content,
+        'created_at', c.created_at,
+        'updated_at', c.updated_at
+    )
+"""
+
+
+def _comment_from_json(row: dict) -> dict:
+    row["created_at"] = datetime.fromisoformat(row["created_at"])
+    row["updated_at"] = datetime.fromisoformat(row["updated_at"])
+    return row
+
+
+def get_post_detail(
+    conn: psycopg.Connection,
+    post_id: int,
+    thread_limit: int = 20,
+    reply_limit: int = 5,
+    cursor: str | None = None,
+) -> dict | None:
+    after_created_at, after_id = decode_cursor(cursor) if cursor else (None, None)
+
     with conn.cursor() as cur:
-        cur.execute("SELECT 1 FROM sns_posts WHERE id = %s AND user_id = %s", (post_id, user_id))
-        return cur.fetchone() is not None
+        cur.execute(
+            f"""
+            WITH RECURSIVE roots AS (
+                SELECT c.id, c.created_at
+                FROM sns_comments c
+                WHERE c.post_id = %(post_id)s
+                  AND c.parent_comment_id IS NULL
+                  AND (%(after_id)s::BIGINT IS NULL OR (c.created_at, c.id) > (%(after_created_at)s, %(after_id)s))
+                ORDER BY c.created_at ASC, c.id ASC
+                LIMIT %(thread_limit)s + 1
+            ),
+            page AS (
+                SELECT id, created_at
+                FROM roots
+                ORDER BY created_at ASC, id ASC
+                LIMIT %(thread_limit)s
+            ),
+            tree AS (
+                SELECT r.id, r.id AS root_id
+                FROM sns_comments r
+                INNER JOIN page ON r.parent_comment_id = page.id
+                UNION ALL
+                SELECT c.id, tree.root_id
+                FROM sns_comments c
+                INNER JOIN tree ON c.parent_comment_id = tree.id
+            ),
+            ranked AS (
+                SELECT tree.root_id,
+                       c.id,
+                       ROW_NUMBER() OVER (PARTITION BY tree.root_id ORDER BY c.created_at ASC, c.id ASC) AS position,
+                       COUNT(*) OVER (PARTITION BY tree.root_id) AS reply_count
+                FROM tree
+                INNER JOIN sns_comments c ON c.id = tree.id
+            )
+            SELECT (
+                       SELECT row_to_json(p)
+                       FROM (
+                           SELECT p.id, p.user_id, p.bot_id, b.name AS bot_name, p.category, p.title, p.content,
+                                  p.is_anonymous, p.created_at, p.updated_at, p.comment_count
+                           FROM sns_posts p
+                           LEFT JOIN bots b ON b.id = p.bot_id
+                           WHERE p.id = %(post_id)s
+                       ) p
+                   ) AS post,
+                   (SELECT COUNT(*) FROM roots) > %(thread_limit)s AS has_more_threads,
+                   (
+                       SELECT COALESCE(json_agg({_COMMENT_JSON} ORDER BY c.created_at ASC, c.id ASC), '[]'::json)
+                       FROM page
+                       INNER JOIN sns_comments c ON c.id = page.id
+                       LEFT JOIN bots b ON b.id = c.bot_id
+                   ) AS threads,
+                   (
+                       SELECT COALESCE(json_object_agg(root_id, reply_count), '{{}}'::json)
+                       FROM (SELECT DISTINCT root_id, reply_count FROM ranked) counts
+                   ) AS reply_counts,
+                   (
+                       SELECT COALESCE(
+                           json_agg(
+                               json_build_object('root_id', ranked.root_id, 'comment', {_COMMENT_JSON})
+                               ORDER BY c.created_at ASC, c.id ASC
+                           ),
+                           '[]'::json
+                       )
+                       FROM ranked
+                       INNER JOIN sns_comments c ON c.id = ranked.id
+                       LEFT JOIN bots b ON b.id = c.bot_id
+                       WHERE ranked.position <= %(reply_limit)s
+                   ) AS replies
+            """,
+            {
+                "post_id": post_id,
+                "after_created_at": after_created_at,
+                "after_id": after_id,
+                "thread_limit": thread_limit,
+                "reply_limit": reply_limit,
+            },
+        )
+        row = cur.fetchone()
 
+    if row["post"] is None:
+        return None
+
+    post = row["post"]
+    post["created_at"] = datetime.fromisoformat(post["created_at"])
+    post["updated_at"] = datetime.fromisoformat(post["updated_at"])
+
+    threads = []
+    nodes: dict[int, dict] = {}
+    for comment in row["threads"]:
+        node = {
+            **_comment_from_json(comment),
+            "replies": [],
+            "reply_count": row["reply_counts"].get(str(comment["id"]), 0),
+            "has_more_replies": False,
+            "next_reply_cursor": None,
+        }
+        nodes[node["id"]] = node
+        threads.append(node)
+
+    loaded: dict[int, int] = {}
+    for reply in row["replies"]:
+        node = {**_comment_from_json(reply["comment"]), "replies": []}
+        nodes[node["id"]] = node
+        parent = nodes.get(node["parent_comment_id"], nodes[reply["root_id"]])
+        parent["replies"].append(node)
+        loaded[reply["root_id"]] = loaded.get(reply["root_id"], 0) + 1
+        nodes[reply["root_id"]]["next_reply_cursor"] = encode_cursor(node)
+
+    for root in threads:
+        root["has_more_replies"] = root["reply_count"] > loaded.get(root["id"], 0)
+        if not root["has_more_replies"]:
+            root["next_reply_cursor"] = None
+
+    return {
+        "post": post,
+        "threads": threads,
+        "next_cursor": encode_cursor(threads[-1]) if threads and row["has_more_threads"] else None,
+    }
+
+
+def list_thread_replies(
+    conn: psycopg.Connection,
+    comment_id: int,
+    limit: int = 20,
+    cursor: str | None = None,
+) -> dict:
+    after_created_at, after_id = decode_cursor(cursor) if cursor else (None, None)
 
-def _has_post_today_by_bot(conn: psycopg.Connection, bot_id: int) -> bool:
     with conn.cursor() as cur:
         cur.execute(
             """
-            SELECT 1
-            FROM sns_posts
-            WHERE bot_id = %s
-              AND created_at >= date_trunc('day', NOW())
-            LIMIT 1
+            WITH RECURSIVE tree AS (
+                SELECT id
+                FROM sns_comments
+                WHERE parent_comment_id = %(comment_id)s
+                UNION ALL
+                SELECT c.id
+                FROM sns_comments c
+                INNER JOIN tree ON c.parent_comment_id = tree.id
+            )
+            SELECT c.id,
+                   c.post_id,
+                   c.user_id,
+                   c.bot_id,
+                   c.parent_comment_id,
+                   b.name AS bot_name,
+                   c.content,
+                   c.created_at,
+                   c.updated_at
+            FROM tree
+            INNER JOIN sns_comments c ON c.id = tree.id
+            LEFT JOIN bots b ON b.id = c.bot_id
+            WHERE %(after_id)s::BIGINT IS NULL OR (c.created_at, c.id) > (%(after_created_at)s, %(after_id)s)
+            ORDER BY c.created_at ASC, c.id ASC
+            LIMIT %(limit)s + 1
             """,
-            (bot_id,),
+            {"comment_id": comment_id, "after_created_at": after_created_at, "after_id": after_id, "limit": limit},
         )
-        return cur.fetchone() is not None
+        rows = list(cur.fetchall())
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    return {"items": rows, "next_cursor": encode_cursor(rows[-1]) if rows and has_more else None}
 
 
 def create_post(
@@ -86,33 +409,54 @@ def create_post(
     is_anonymous: bool,
     bot_id: int | None,
 ) -> dict:
-    with conn.cursor() as cur:
-        if bot_id is not None:
-            cur.execute("SELECT id FROM bots WHERE id = %s AND user_id = %s", (bot_id, user_id))
-            if not cur.fetchone():
-                raise ValueError("유효하지 않은 봇입니다.")
-
-    if bot_id is not None and _has_post_today_by_bot(conn, bot_id):
-        raise ValueError("봇은 하루에 한 번만 글을 작성할 수 있습니다.")
-
     with conn.cursor() as cur:
         cur.execute(
             """
-            INSERT INTO sns_posts (user_id, bot_id, category, title, content, is_anonymous)
-            VALUES (%s, %s, %s, %s, %s, %s)
-            RETURNING id,
-                      user_id,
-                      bot_id,
-                      category,
-                      title,
-                      content,
-                      is_anonymous,
-                      created_at,
-                      updated_at
+            WITH checks AS (
+                SELECT (
+                    %(bot_id)s::BIGINT IS NULL
+                    OR EXISTS (SELECT 1 FROM bots WHERE id = %(bot_id)s AND user_id = %(user_id)s)
+                ) AS bot_ok
+            ),
+            inserted AS (
+                INSERT INTO sns_posts (user_id, bot_id, category, title, content, is_anonymous)
+                SELECT %(user_id)s, %(bot_id)s, %(category)s, %(title)s, %(content)s, %(is_anonymous)s
+                FROM checks
+                WHERE CASE
+                    WHEN NOT checks.bot_ok THEN FALSE
+                    WHEN %(bot_id)s::BIGINT IS NULL THEN TRUE
+                    ELSE claim_bot_post_day(%(bot_id)s)
+                END
+                RETURNING id,
+                          user_id,
+                          bot_id,
+                          category,
+                          title,
+                          content,
+                          is_anonymous,
+                          created_at,
+                          updated_at,
+                          comment_count
+            )
+            SELECT checks.bot_ok, i.*, b.name AS bot_name
+            FROM checks
+            LEFT JOIN inserted i ON TRUE
+            LEFT JOIN bots b ON b.id = i.bot_id
             """,
-            (user_id, bot_id, category, title, content, is_anonymous),
+            {
+                "user_id": user_id,
+                "bot_id": bot_id,
+                "category": category,
+                "title": title,
+                "content": content,
+                "is_anonymous": is_anonymous,
+            },
         )
         row = cur.fetchone()
+        if not row.pop("bot_ok"):
+            raise ValueError("유효하지 않은 봇입니다.")
+        if row["id"] is None:
+            raise ValueError("봇은 하루에 한 번만 글을 작성할 수 있습니다.")
         conn.commit()
         return row
 
@@ -123,57 +467,124 @@ def update_post(
     user_id: int,
     payload: dict,
 ) -> dict | None:
-    if not is_post_owner(conn, post_id, user_id):
-        return None
-
     allowed_keys = {"category", "title", "content", "is_anonymous", "bot_id"}
     updates = {key: value for key, value in payload.items() if key in allowed_keys and value is not None}
 
-    if "bot_id" in updates:
-        with conn.cursor() as cur:
-            cur.execute("SELECT id FROM bots WHERE id = %s AND user_id = %s", (updates["bot_id"], user_id))
-            if not cur.fetchone():
-                raise ValueError("유효하지 않은 봇입니다.")
-
     if not updates:
-        return get_post_by_id(conn, post_id)
+        row = get_post_by_id(conn, post_id)
+        return row if row and row["user_id"] == user_id else None
 
-    fields = [f"{key} = %s" for key in updates]
-    values = list(updates.values())
-    values.extend([post_id, user_id])
+    fields = [f"{key} = %({key})s" for key in updates]
 
     with conn.cursor() as cur:
         cur.execute(
             f"""
-            UPDATE sns_posts
-            SET {', '.join(fields)},
-                updated_at = NOW()
-            WHERE id = %s AND user_id = %s
-            RETURNING id,
-                      user_id,
-                      bot_id,
-                      category,
-                      title,
-                      content,
-                      is_anonymous,
-                      created_at,
-                      updated_at
+            WITH checks AS (
+                SELECT EXISTS (SELECT 1 FROM sns_posts WHERE id = %(post_id)s AND user_id = %(user_id)s) AS owner_ok,
+                       (
+                           %(bot_id)s::BIGINT IS NULL
+                           OR EXISTS (SELECT 1 FROM bots WHERE id = %(bot_id)s AND user_id = %(user_id)s)
+                       ) AS bot_ok
+            ),
+            updated AS (
+                UPDATE sns_posts p
+                SET {', '.join(fields)},
+                    updated_at = NOW()
+                FROM checks
+                WHERE p.id = %(post_id)s
+                  AND p.user_id = %(user_id)s
+                  AND checks.bot_ok
+                RETURNING p.id,
+                          p.user_id,
+                          p.bot_id,
+                          p.category,
+                          p.title,
+                          p.content,
+                          p.is_anonymous,
+                          p.created_at,
+                          p.updated_at,
+                          p.comment_count
+            )
+            SELECT checks.owner_ok, checks.bot_ok, u.*, b.name AS bot_name
+            FROM checks
+            LEFT JOIN updated u ON TRUE
+            LEFT JOIN bots b ON b.id = u.bot_id
             """,
-            tuple(values),
+            {"post_id": post_id, "user_id": user_id, "bot_id": updates.get("bot_id"), **updates},
         )
         row = cur.fetchone()
+        if not row.pop("owner_ok"):
+            return None
+        if not row.pop("bot_ok"):
+            raise ValueError("유효하지 않은 봇입니다.")
+        if row["id"] is None:
+            conn.rollback()
+            return None
         conn.commit()
+        invalidate_post(post_id)
         return row
 
 
 def delete_post(conn: psycopg.Connection, post_id: int, user_id: int) -> bool:
     with conn.cursor() as cur:
-        cur.execute("DELETE FROM sns_posts WHERE id = %s AND user_id = %s", (post_id, user_id))
-        deleted = cur.rowcount > 0
+        cur.execute(
+            """
+            WITH deleted AS (
+                DELETE FROM sns_posts
+                WHERE id = %(post_id)s AND user_id = %(user_id)s
+                RETURNING id, bot_id, created_at
+            ),
+            released AS (
+                UPDATE bots b
+                SET last_post_on = NULL
+                FROM deleted d
+                WHERE b.id = d.bot_id
+                  AND b.last_post_on = CURRENT_DATE
+                  AND d.created_at >= CURRENT_DATE
+                  AND NOT EXISTS (
+                      SELECT 1
+                      FROM sns_posts p
+                      WHERE p.bot_id = d.bot_id
+                        AND p.id <> d.id
+                        AND p.created_at >= CURRENT_DATE
+                  )
+                RETURNING b.id
+            )
+            SELECT EXISTS (SELECT 1 FROM deleted) AS deleted
+            """,
+            {"post_id": post_id, "user_id": user_id},
+        )
+        deleted = cur.fetchone()["deleted"]
         conn.commit()
+        if deleted:
+            invalidate_post(post_id)
         return deleted
 
 
+def repair_comment_counts(conn: psycopg.Connection, post_id: int | None = None) -> int:
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            UPDATE sns_posts p
+            SET comment_count = counted.comment_count
+            FROM (
+                SELECT sp.id, COUNT(c.id)::INT AS comment_count
+                FROM sns_posts sp
+                LEFT JOIN sns_comments c ON c.post_id = sp.id
+                WHERE %(post_id)s::BIGINT IS NULL OR sp.id = %(post_id)s::BIGINT
+                GROUP BY sp.id
+            ) counted
+            WHERE p.id = counted.id
+              AND p.comment_count <> counted.comment_count
+            """,
+            {"post_id": post_id},
+        )
+        repaired = cur.rowcount
+        conn.commit()
+        invalidate_post(post_id)
+        return repaired
+
+
 def list_comments(conn: psycopg.Connection, post_id: int) -> list[dict]:
     with conn.cursor() as cur:
         cur.execute(
@@ -205,33 +616,54 @@ def create_comment(
     bot_id: int | None = None,
     parent_comment_id: int | None = None,
 ) -> dict:
-    if not get_post_by_id(conn, post_id):
-        raise ValueError("게시글을 찾을 수 없습니다.")
-
     with conn.cursor() as cur:
-        if bot_id is not None:
-            cur.execute("SELECT id FROM bots WHERE id = %s AND user_id = %s", (bot_id, user_id))
-            if not cur.fetchone():
-                raise ValueError("유효하지 않은 봇입니다.")
-
-        if parent_comment_id is not None:
-            cur.execute(
-                "SELECT id FROM sns_comments WHERE id = %s AND post_id = %s",
-                (parent_comment_id, post_id),
-            )
-            if not cur.fetchone():
-                raise ValueError("대댓글 대상 댓글을 찾을 수 없습니다.")
-
         cur.execute(
             """
-            INSERT INTO sns_comments (post_id, user_id, bot_id, parent_comment_id, content)
-            VALUES (%s, %s, %s, %s, %s)
-            RETURNING id, post_id, user_id, bot_id, parent_comment_id, content, created_at, updated_at
+            WITH checks AS (
+                SELECT EXISTS (SELECT 1 FROM sns_posts WHERE id = %(post_id)s) AS post_ok,
+                       (
+                           %(bot_id)s::BIGINT IS NULL
+                           OR EXISTS (SELECT 1 FROM bots WHERE id = %(bot_id)s AND user_id = %(user_id)s)
+                       ) AS bot_ok,
+                       (
+                           %(parent_comment_id)s::BIGINT IS NULL
+                           OR EXISTS (
+                               SELECT 1
+                               FROM sns_comments
+                               WHERE id = %(parent_comment_id)s
+                                 AND post_id = %(post_id)s
+                           )
+                       ) AS parent_ok
+            ),
+            inserted AS (
+                INSERT INTO sns_comments (post_id, user_id, bot_id, parent_comment_id, content)
+                SELECT %(post_id)s, %(user_id)s, %(bot_id)s, %(parent_comment_id)s, %(content)s
+                FROM checks
+                WHERE checks.post_ok AND checks.bot_ok AND checks.parent_ok
+                RETURNING id, post_id, user_id, bot_id, parent_comment_id, content, created_at, updated_at
+            )
+            SELECT checks.post_ok, checks.bot_ok, checks.parent_ok, i.*, b.name AS bot_name
+            FROM checks
+            LEFT JOIN inserted i ON TRUE
+            LEFT JOIN bots b ON b.id = i.bot_id
             """,
-            (post_id, user_id, bot_id, parent_comment_id, content),
+            {
+                "post_id": post_id,
+                "user_id": user_id,
+                "bot_id": bot_id,
+                "parent_comment_id": parent_comment_id,
+                "content": content,
+            },
         )
         row = cur.fetchone()
+        if not row.pop("post_ok"):
+            raise ValueError("게시글을 찾을 수 없습니다.")
+        if not row.pop("bot_ok"):
+            raise ValueError("유효하지 않은 봇입니다.")
+        if not row.pop("parent_ok"):
+            raise ValueError("대댓글 대상 댓글을 찾을 수 없습니다.")
         conn.commit()
+        invalidate_post(post_id)
         return row
 
 
@@ -239,16 +671,23 @@ def update_comment(conn: psycopg.Connection, comment_id: int, user_id: int, cont
     with conn.cursor() as cur:
         cur.execute(
             """
-            UPDATE sns_comments
-            SET content = %s,
-                updated_at = NOW()
-            WHERE id = %s AND user_id = %s
-            RETURNING id, post_id, user_id, bot_id, parent_comment_id, content, created_at, updated_at
+            WITH updated AS (
+                UPDATE sns_comments
+                SET content = %s,
+                    updated_at = NOW()
+                WHERE id = %s AND user_id = %s
+                RETURNING id, post_id, user_id, bot_id, parent_comment_id, content, created_at, updated_at
+            )
+            SELECT u.*, b.name AS bot_name
+            FROM updated u
+            LEFT JOIN bots b ON b.id = u.bot_id
             """,
             (content, comment_id, user_id),
         )
         row = cur.fetchone()
         conn.commit()
+        if row:
+            invalidate_post(row["post_id"])
         return row
 
 
@@ -258,9 +697,12 @@ def delete_comment(conn: psycopg.Connection, comment_id: int, user_id: int) -> b
             """
             DELETE FROM sns_comments
             WHERE id = %s AND user_id = %s
+            RETURNING post_id
             """,
             (comment_id, user_id),
         )
-        deleted = cur.rowcount > 0
+        row = cur.fetchone()
         conn.commit()
-        return deleted
+        if row:
+            invalidate_post(row["post_id"])
+        return row is not None
@@ -0,0 +1,126 @@
+"""realtime fan-out 벤치마크.
+
+사용자 1명에게 연결된 가짜 WebSocket N개(기본 10,000)로 이벤트를 브로드캐스트하면서
+기존 방식(소켓마다 json.dumps + 순차 send_text)과 현재 `RealtimeManager`(1회 인코딩 + 연결별 큐/writer)를 비교한다.
+일부 소켓은 느린 클라이언트로 만들어 한 소켓이 전체 전송을 지연시키는지 확인한다.
+
+    python scripts/bench_realtime_fanout.py --sockets 10000 --events 20
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app import realtime  # noqa: E402
+from app.realtime import RealtimeManager, _to_payload  # noqa: E402
+
+
+class FakeWebSocket:
+    def __init__(self, delay: float) -> None:
+        self.delay = delay
+        self.received = 0
+
+    async def accept(self) -> None:
+        return None
+
+    async def send_text(self, message: str) -> None:
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.received += 1
+
+    async def close(self, code: int = 1000, reason: str | None = None) -> None:
+        return None
+
+
+def make_payload(log_id: int) -> dict:
+    return _to_payload(
+        {
+            "id": log_id,
+            "bot_id": 1,
+            "job_id": 1,
+            "job_type": "ai_create_comment",
+            "result_status": "success",
+            "message": "벤치 봇이 게시글 #1에 댓글 #1 등록 " * 4,
+            "executed_at": datetime.now(UTC),
+        }
+    )
+
+
+def make_sockets(args: argparse.Namespace) -> list[FakeWebSocket]:
+    return [FakeWebSocket(args.slow_delay if i < args.slow else 0.0) for i in range(args.sockets)]
+
+
+async def wait_fast_sockets(manager: RealtimeManager, sockets: list[FakeWebSocket], args: argparse.Namespace) -> None:
+    pending = sockets[args.slow :]
+    while pending:
+        connected = manager.connections.get(1, {})
+        pending = [ws for ws in pending if ws.received < args.events and ws in connected]
+        await asyncio.sleep(0.01)
+
+
+async def run_legacy(args: argparse.Namespace) -> None:
+    sockets = make_sockets(args)
+    wall = time.perf_counter()
+    cpu = time.process_time()
+    for log_id in range(1, args.events + 1):
+        payload = make_payload(log_id)
+        for ws in sockets:
+            await ws.send_text(json.dumps(payload, ensure_ascii=False))
+    report("legacy", args, wall, cpu)
+
+
+async def run_stream(args: argparse.Namespace) -> None:
+    manager = RealtimeManager()
+    sockets = make_sockets(args)
+    for ws in sockets:
+        upto_id = await manager.connect(1, ws)
+        await manager.open_stream(1, ws, None, upto_id)
+
+    wall = time.perf_counter()
+    cpu = time.process_time()
+    for log_id in range(1, args.events + 1):
+        await manager.broadcast_activity_log(1, make_payload(log_id))
+        await asyncio.sleep(0)
+    await wait_fast_sockets(manager, sockets, args)
+    report("stream", args, wall, cpu, connected=len(manager.connections.get(1, {})))
+
+    for ws in list(manager.connections.get(1, {})):
+        await manager.disconnect(1, ws)
+    manager.close()
+
+
+def report(name: str, args: argparse.Namespace, wall: float, cpu: float, connected: int | None = None) -> None:
+    elapsed = time.perf_counter() - wall
+    cpu_used = time.process_time() - cpu
+    deliveries = args.sockets * args.events
+    extra = f" connected={connected}" if connected is not None else ""
+    print(
+        f"{name:7s} sockets={args.sockets} events={args.events} wall={elapsed:7.3f}s cpu={cpu_used:7.3f}s "
+        f"deliveries/s={deliveries / elapsed:12.0f}{extra}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sockets", type=int, default=10000)
+    parser.add_argument("--events", type=int, default=20)
+    parser.add_argument("--slow", type=int, default=10)
+    parser.add_argument("--slow-delay", type=float, default=0.05)
+    parser.add_argument("--policy", choices=["disconnect", "drop_oldest"], default="disconnect")
+    parser.add_argument("--queue-size", type=int, default=16)
+    args = parser.parse_args()
+
+    realtime.REALTIME_SLOW_CONSUMER_POLICY = args.policy
+    realtime.REALTIME_SEND_QUEUE_SIZE = args.queue_size
+    asyncio.run(run_legacy(args))
+    asyncio.run(run_stream(args))
+
+
+if __name__ == "__main__":
+    main()
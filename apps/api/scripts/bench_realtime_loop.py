@@ -0,0 +1,87 @@
+"""realtime poller 이벤트 루프 블로킹 벤치마크.
+
+DB 조회를 `time.sleep`으로 흉내 낸 뒤, poller가 이벤트 루프에서 직접 조회하는 경우(before)와
+전용 executor로 넘기는 경우(after)의 WebSocket 전송 지연(루프 지연)을 HTTP 부하와 함께 비교한다.
+
+    python scripts/bench_realtime_loop.py --db-latency 0.05 --duration 5
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from starlette.concurrency import run_in_threadpool  # noqa: E402
+
+from app.realtime import manager  # noqa: E402
+
+
+def fake_query(latency: float) -> list[dict]:
+    time.sleep(latency)
+    return []
+
+
+async def poller(mode: str, latency: float, interval: float, stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        if mode == "inline":
+            fake_query(latency)
+        else:
+            await manager.run_db(fake_query, latency)
+        await asyncio.sleep(interval)
+
+
+async def http_load(latency: float, stop: asyncio.Event, counter: list[int]) -> None:
+    while not stop.is_set():
+        await run_in_threadpool(fake_query, latency)
+        counter[0] += 1
+
+
+async def ws_probe(period: float, samples: list[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(period)
+        samples.append((time.perf_counter() - started - period) * 1000)
+
+
+async def run(mode: str, args: argparse.Namespace) -> None:
+    stop = asyncio.Event()
+    samples: list[float] = []
+    counter = [0]
+    tasks = [asyncio.create_task(poller(mode, args.db_latency, args.poll_interval, stop))]
+    tasks += [asyncio.create_task(http_load(args.db_latency, stop, counter)) for _ in range(args.http_concurrency)]
+    tasks += [asyncio.create_task(ws_probe(args.probe_period, samples, stop)) for _ in range(args.websockets)]
+
+    await asyncio.sleep(args.duration)
+    stop.set()
+    await asyncio.gather(*tasks)
+
+    samples.sort()
+    p95 = samples[int(len(samples) * 0.95)]
+    p99 = samples[int(len(samples) * 0.99)]
+    print(
+        f"{mode:9s} ws_lag_ms p50={statistics.median(samples):7.2f} p95={p95:7.2f} p99={p99:7.2f} "
+        f"max={samples[-1]:7.2f} http_rps={counter[0] / args.duration:8.1f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--db-latency", type=float, default=0.05)
+    parser.add_argument("--poll-interval", type=float, default=0.01)
+    parser.add_argument("--http-concurrency", type=int, default=20)
+    parser.add_argument("--websockets", type=int, default=100)
+    parser.add_argument("--probe-period", type=float, default=0.01)
+    args = parser.parse_args()
+
+    for mode in ("inline", "executor"):
+        asyncio.run(run(mode, args))
+    manager.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""목록 응답 직렬화 CPU 벤치마크.
+
+`dict_row` 결과 N건을 응답 바이트로 만드는 데 드는 요청당 CPU 시간을 비교한다.
+- before: `SnsPostResponse(**row)` 생성 → FastAPI `response_model` 재검증 + `jsonable_encoder` → stdlib json
+- after: `dump_rows`로 스키마 필드만 추린 dict → `ORJSONResponse` (한 번만 인코딩)
+
+    python scripts/bench_response_serialization.py --rows 1000 --iterations 50
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from fastapi.responses import JSONResponse  # noqa: E402
+from fastapi.routing import APIRoute, serialize_response  # noqa: E402
+
+from app import main  # noqa: E402
+from app.schemas import SnsCommentResponse, SnsPostPageResponse, SnsPostResponse  # noqa: E402
+from app.serializers import ORJSONResponse, dump_rows  # noqa: E402
+
+
+def make_post_rows(count: int) -> list[dict]:
+    now = datetime.now(UTC)
+    return [
+        {
+            "id": index,
+            "user_id": index % 7,
+            "bot_id": index % 11,
+            "category": "경제",
+            "title": f"게시글 제목 {index}",
+            "content": "본문 " * 40,
+            "is_anonymous": bool(index % 2),
+            "created_at": now - timedelta(seconds=index),
+            "updated_at": now - timedelta(seconds=index),
+            "bot_name": f"bot-{index % 11}",
+            "comment_count": index % 13,
+        }
+        for index in range(count)
+    ]
+
+
+def make_comment_rows(count: int) -> list[dict]:
+    now = datetime.now(UTC)
+    return [
+        {
+            "id": index,
+            "post_id": 1,
+            "user_id": index % 7,
+            "bot_id": index % 11,
+            "parent_comment_id": index - 1 if index % 3 else None,
+            "bot_name": f"bot-{index % 11}",
+            "content": "댓글 " * 20,
+            "created_at": now - timedelta(seconds=index),
+            "updated_at": now - timedelta(seconds=index),
+        }
+        for index in range(count)
+    ]
+
+
+def response_field(path: str):
+    for route in main.app.routes:
+        if isinstance(route, APIRoute) and route.path == path and "GET" in route.methods:
+            return route.response_field
+    raise LookupError(path)
+
+
+async def posts_before(rows: list[dict], field) -> bytes:
+    for row in rows:
+        row["can_edit"] = row["user_id"] == 1
+    content = SnsPostPageResponse(items=[SnsPostResponse(**row) for row in rows], next_cursor="x", prev_cursor=None)
+    return JSONResponse(await serialize_response(field=field, response_content=content)).body
+
+
+async def posts_after(rows: list[dict], field) -> bytes:
+    for row in rows:
+        row["can_edit"] = row["user_id"] == 1
+    return ORJSONResponse({"items": dump_rows(SnsPostResponse, rows), "next_cursor": "x", "prev_cursor": None}).body
+
+
+async def comments_before(rows: list[dict], field) -> bytes:
+    for row in rows:
+        row["can_edit"] = row["user_id"] == 1
+    content = [SnsCommentResponse(**row) for row in rows]
+    return JSONResponse(await serialize_response(field=field, response_content=content)).body
+
+
+async def comments_after(rows: list[dict], field) -> bytes:
+    for row in rows:
+        row["can_edit"] = row["user_id"] == 1
+    return ORJSONResponse(dump_rows(SnsCommentResponse, rows)).body
+
+
+async def measure(fn, rows: list[dict], field, iterations: int) -> tuple[list[float], int]:
+    samples = []
+    size = 0
+    for _ in range(iterations):
+        batch = [dict(row) for row in rows]
+        started = time.process_time()
+        size = len(await fn(batch, field))
+        samples.append((time.process_time() - started) * 1000)
+    return samples, size
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    cases = [
+        ("GET /sns/posts", "/sns/posts", make_post_rows(args.rows), posts_before, posts_after),
+        ("GET /sns/posts/{id}/comments", "/sns/posts/{post_id}/comments", make_comment_rows(args.rows), comments_before, comments_after),
+    ]
+    print(f"rows={args.rows} iterations={args.iterations} (요청당 CPU ms)")
+    for label, path, rows, before, after in cases:
+        field = response_field(path)
+        results = {}
+        for name, fn in (("before", before), ("after", after)):
+            await measure(fn, rows, field, 3)
+            samples, size = await measure(fn, rows, field, args.iterations)
+            results[name] = statistics.median(samples)
+            print(
+                f"{label:32s} {name:6s} p50={statistics.median(samples):7.2f}ms "
+                f"p95={sorted(samples)[int(len(samples) * 0.95) - 1]:7.2f}ms bytes={size}"
+            )
+        print(f"{label:32s} speedup x{results['before'] / results['after']:.1f}")
+
+
+def main_cli() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--iterations", type=int, default=50)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,120 @@
+"""게시글/댓글 쓰기 API의 DB 왕복 횟수 검사.
+
+엔드포인트 함수를 DB 대신 쿼리 수를 세는 가짜 연결로 직접 호출해, 각 쓰기 경로가
+검증 + 쓰기 + 응답 행 조회(`bot_name` 포함)를 한 번의 쿼리로 끝내는지 확인한다.
+기대 횟수와 다르면 종료 코드 1.
+
+    python scripts/check_write_round_trips.py
+"""
+
+import sys
+from datetime import UTC, datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app import main  # noqa: E402
+from app.schemas import (  # noqa: E402
+    SnsCommentCreateRequest,
+    SnsCommentUpdateRequest,
+    SnsPostCreateRequest,
+    SnsPostUpdateRequest,
+)
+
+NOW = datetime.now(UTC)
+ROW = {
+    "id": 1,
+    "post_id": 1,
+    "user_id": 1,
+    "bot_id": 2,
+    "bot_name": "bench-bot",
+    "parent_comment_id": None,
+    "category": "경제",
+    "title": "title",
+    "content": "content",
+    "is_anonymous": True,
+    "created_at": NOW,
+    "updated_at": NOW,
+    "comment_count": 0,
+    "owner_ok": True,
+    "post_ok": True,
+    "bot_ok": True,
+    "parent_ok": True,
+}
+
+
+class CountingCursor:
+    def __init__(self, conn: "CountingConnection") -> None:
+        self.conn = conn
+
+    def __enter__(self) -> "CountingCursor":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+    def execute(self, query: str, params=None) -> None:
+        self.conn.queries += 1
+
+    def fetchone(self) -> dict:
+        return dict(ROW)
+
+    def fetchall(self) -> list[dict]:
+        return [dict(ROW)]
+
+
+class CountingConnection:
+    def __init__(self) -> None:
+        self.queries = 0
+
+    def cursor(self) -> CountingCursor:
+        return CountingCursor(self)
+
+    def commit(self) -> None:
+        return None
+
+    def rollback(self) -> None:
+        return None
+
+
+CASES = [
+    (
+        "POST /sns/posts",
+        lambda conn, user: main.create_sns_post(SnsPostCreateRequest(title="t", content="c", bot_id=2), user, conn),
+        1,
+    ),
+    (
+        "PATCH /sns/posts/{id}",
+        lambda conn, user: main.patch_sns_post(1, SnsPostUpdateRequest(title="t2", bot_id=2), user, conn),
+        1,
+    ),
+    (
+        "POST /sns/posts/{id}/comments",
+        lambda conn, user: main.create_sns_comment(
+            1, SnsCommentCreateRequest(content="c", bot_id=2, parent_comment_id=3), user, conn
+        ),
+        1,
+    ),
+    (
+        "PATCH /sns/comments/{id}",
+        lambda conn, user: main.patch_sns_comment(1, SnsCommentUpdateRequest(content="c2"), user, conn),
+        1,
+    ),
+]
+
+
+def main_check() -> None:
+    user = {"id": 1}
+    failed = False
+    for name, call, expected in CASES:
+        conn = CountingConnection()
+        response = call(conn, user)
+        ok = conn.queries == expected and response.bot_name == ROW["bot_name"]
+        failed = failed or not ok
+        print(f"{'ok  ' if ok else 'FAIL'} {name:32s} queries={conn.queries} expected={expected}")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main_check()
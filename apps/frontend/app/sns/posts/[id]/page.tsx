@@ -2,9 +2,9 @@
 
 import Link from 'next/link';
 import { useParams } from 'next/navigation';
-import { useEffect, useMemo, useState } from 'react';
+import { useEffect, useState } from 'react';
 
-import { Bot, SnsComment, SnsPost, apiClient, authHeader } from '../../../../lib/api';
+import { Bot, SnsCommentNode, SnsCommentPage, SnsPost, SnsPostDetail, apiClient, authHeader } from '../../../../lib/api';
 import { useAppStore } from '../../../../stores/app-store';
 
 export default function SnsPostDetailPage() {
@@ -13,7 +13,8 @@ export default function SnsPostDetailPage() {
   const hydrate = useAppStore((s) => s.hydrate);
 
   const [post, setPost] = useState<SnsPost | null>(null);
-  const [comments, setComments] = useState<SnsComment[]>([]);
+  const [threads, setThreads] = useState<SnsCommentNode[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
   const [bots, setBots] = useState<Bot[]>([]);
   const [commentBotId, setCommentBotId] = useState('');
   const [newComment, setNewComment] = useState('');
@@ -24,27 +25,60 @@ export default function SnsPostDetailPage() {
     hydrate();
   }, [hydrate]);
 
-  const loadComments = async () => {
+  const loadDetail = async (cursor: string | null = null) => {
     if (!token || !params.id) return;
     try {
-      const res = await apiClient.get<SnsComment[]>(`/sns/posts/${params.id}/comments`, { headers: authHeader(token) });
-      setComments(res.data);
+      const res = await apiClient.get<SnsPostDetail>(`/sns/posts/${params.id}/detail`, {
+        headers: authHeader(token),
+        params: cursor ? { cursor } : undefined,
+      });
+      setPost(res.data.post);
+      setThreads((prev) => (cursor ? [...prev, ...res.data.threads] : res.data.threads));
+      setNextCursor(res.data.next_cursor);
     } catch {
-      setComments([]);
+      setError('게시글 조회 실패');
+    }
+  };
+
+  const loadMoreReplies = async (root: SnsCommentNode) => {
+    if (!token) return;
+    try {
+      const res = await apiClient.get<SnsCommentPage>(`/sns/comments/${root.id}/replies`, {
+        headers: authHeader(token),
+        params: root.next_reply_cursor ? { cursor: root.next_reply_cursor } : undefined,
+      });
+      setThreads((prev) => prev.map((thread) => {
+        if (thread.id !== root.id) return thread;
+
+        const copy: SnsCommentNode = structuredClone(thread);
+        const nodes = new Map<number, SnsCommentNode>();
+        const collect = (node: SnsCommentNode) => {
+          nodes.set(node.id, node);
+          node.replies.forEach(collect);
+        };
+        collect(copy);
+
+        res.data.items.forEach((item) => {
+          if (nodes.has(item.id)) return;
+          const node: SnsCommentNode = { ...item, replies: [], reply_count: 0, has_more_replies: false, next_reply_cursor: null };
+          nodes.set(node.id, node);
+          (nodes.get(item.parent_comment_id ?? copy.id) ?? copy).replies.push(node);
+        });
+        copy.has_more_replies = res.data.next_cursor !== null;
+        copy.next_reply_cursor = res.data.next_cursor;
+        return copy;
+      }));
+    } catch {
+      setError('답글 조회 실패');
     }
   };
 
   useEffect(() => {
     if (!token || !params.id) return;
 
-    const headers = { headers: authHeader(token) };
-    apiClient.get<SnsPost>(`/sns/posts/${params.id}`, headers)
-      .then((res) => setPost(res.data))
-      .catch(() => setError('게시글 조회 실패'));
-
-    loadComments();
+    loadDetail();
 
-    apiClient.get<Bot[]>('/bots', headers)
+    apiClient.get<Bot[]>('/bots', { headers: authHeader(token) })
       .then((res) => setBots(res.data))
       .catch(() => setBots([]));
   }, [params.id, token]);
@@ -65,47 +99,32 @@ export default function SnsPostDetailPage() {
       setNewComment('');
       setCommentBotId('');
       setReplyParentId(null);
-      await loadComments();
+      await loadDetail();
     } catch {
       setError('댓글 등록에 실패했습니다.');
     }
   };
 
-  const { roots, childrenMap } = useMemo(() => {
-    const rootsLocal: SnsComment[] = [];
-    const childrenLocal = new Map<number, SnsComment[]>();
-
-    comments.forEach((comment) => {
-      if (!comment.parent_comment_id) {
-        rootsLocal.push(comment);
-        return;
-      }
-      const arr = childrenLocal.get(comment.parent_comment_id) ?? [];
-      arr.push(comment);
-      childrenLocal.set(comment.parent_comment_id, arr);
-    });
-
-    return { roots: rootsLocal, childrenMap: childrenLocal };
-  }, [comments]);
-
-  const renderCommentNode = (comment: SnsComment) => {
-    const replies = childrenMap.get(comment.id) ?? [];
-    return (
-      <li key={comment.id} className="rounded-lg border border-border p-3">
-        <p className="text-sm break-words">{comment.content}</p>
-        <p className="mt-1 text-xs text-fg/70">
-          {comment.bot_name ? `${comment.bot_name} 봇` : '사용자'} · {new Date(comment.created_at).toLocaleString()}
-        </p>
-        <button className="mt-1 text-xs text-primary underline" onClick={() => setReplyParentId(comment.id)}>답글</button>
-
-        {replies.length > 0 && (
-          <ul className="mt-2 space-y-2 border-l border-border pl-3">
-            {replies.map((reply) => renderCommentNode(reply))}
-          </ul>
-        )}
-      </li>
-    );
-  };
+  const renderCommentNode = (comment: SnsCommentNode) => (
+    <li key={comment.id} className="rounded-lg border border-border p-3">
+      <p className="text-sm break-words">{comment.content}</p>
+      <p className="mt-1 text-xs text-fg/70">
+        {comment.bot_name ? `${comment.bot_name} 봇` : '사용자'} · {new Date(comment.created_at).toLocaleString()}
+      </p>
+      <button className="mt-1 text-xs text-primary underline" onClick={() => setReplyParentId(comment.id)}>답글</button>
+
+      {comment.replies.length > 0 && (
+        <ul className="mt-2 space-y-2 border-l border-border pl-3">
+          {comment.replies.map((reply) => renderCommentNode(reply))}
+        </ul>
+      )}
+      {comment.has_more_replies && (
+        <button className="mt-2 text-xs text-primary underline" onClick={() => loadMoreReplies(comment)}>
+          답글 더 보기 ({comment.reply_count}개 중 일부)
+        </button>
+      )}
+    </li>
+  );
 
   return (
     <main className="mx-auto min-h-[100dvh] max-w-2xl bg-bg px-4 pb-[calc(env(safe-area-inset-bottom)+24px)] pt-[calc(env(safe-area-inset-top)+24px)]">
@@ -162,8 +181,13 @@ export default function SnsPostDetailPage() {
         </div>
 
         <ul className="space-y-3">
-          {roots.map((comment) => renderCommentNode(comment))}
+          {threads.map((comment) => renderCommentNode(comment))}
         </ul>
+        {nextCursor && (
+          <button className="mt-3 w-full rounded-lg border border-border px-3 py-2 text-sm" onClick={() => loadDetail(nextCursor)}>
+            댓글 더 보기
+          </button>
+        )}
       </section>
     </main>
   );
@@ -1,15 +1,18 @@
 'use client';
 
 import Link from 'next/link';
-import { useEffect, useMemo, useState } from 'react';
+import { useEffect, useState } from 'react';
 
-import { SnsPost, apiClient, authHeader } from '../../../lib/api';
+import { SnsPost, SnsPostPage, apiClient, authHeader } from '../../../lib/api';
 import { useAppStore } from '../../../stores/app-store';
 
 type CategoryFilter = '전체' | '경제' | '문화' | '연예' | '유머';
 
+const PAGE_SIZE = 20;
+
 export default function SnsPostListPage() {
   const [posts, setPosts] = useState<SnsPost[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
   const [error, setError] = useState('');
   const [categoryFilter, setCategoryFilter] = useState<CategoryFilter>('전체');
   const token = useAppStore((s) => s.accessToken);
@@ -19,15 +22,19 @@ export default function SnsPostListPage() {
     hydrate();
   }, [hydrate]);
 
-  const loadPosts = async () => {
+  const loadPosts = async (cursor: string | null = null) => {
     if (!token) {
       setError('로그인이 필요합니다.');
       return;
     }
 
     try {
-      const res = await apiClient.get<SnsPost[]>('/sns/posts', { headers: authHeader(token) });
-      setPosts(res.data);
+      const params: Record<string, string | number> = { limit: PAGE_SIZE };
+      if (categoryFilter !== '전체') params.category = categoryFilter;
+      if (cursor) params.before = cursor;
+      const res = await apiClient.get<SnsPostPage>('/sns/posts', { headers: authHeader(token), params });
+      setPosts((prev) => (cursor ? [...prev, ...res.data.items] : res.data.items));
+      setNextCursor(res.data.next_cursor);
       setError('');
     } catch {
       setError('게시글 목록 조회에 실패했습니다.');
@@ -38,12 +45,7 @@ export default function SnsPostListPage() {
     if (token) {
       loadPosts();
     }
-  }, [token]);
-
-  const filteredPosts = useMemo(() => {
-    if (categoryFilter === '전체') return posts;
-    return posts.filter((post) => post.category === categoryFilter);
-  }, [posts, categoryFilter]);
+  }, [token, categoryFilter]);
 
   return (
     <main className="mx-auto min-h-[100dvh] max-w-3xl bg-bg px-4 pb-[calc(env(safe-area-inset-bottom)+24px)] pt-[calc(env(safe-area-inset-top)+24px)]">
@@ -67,12 +69,12 @@ export default function SnsPostListPage() {
           <option value="연예">연예</option>
           <option value="유머">유머</option>
         </select>
-        <button className="rounded-lg border border-border px-3 py-2" onClick={loadPosts}>새로고침</button>
+        <button className="rounded-lg border border-border px-3 py-2" onClick={() => loadPosts()}>새로고침</button>
       </div>
       {error && <p className="mb-3 text-sm text-red-500">{error}</p>}
 
       <ul className="space-y-3">
-        {filteredPosts.map((post) => (
+        {posts.map((post) => (
           <li key={post.id} className="rounded-xl border border-border bg-card p-4">
             <div className="mb-1 flex items-center justify-between gap-3">
               <Link className="font-medium text-primary underline" href={`/sns/posts/${post.id}`}>{post.title}</Link>
@@ -87,6 +89,11 @@ export default function SnsPostListPage() {
           </li>
         ))}
       </ul>
+      {nextCursor && (
+        <button className="mt-4 w-full rounded-lg border border-border px-3 py-2" onClick={() => loadPosts(nextCursor)}>
+          더 보기
+        </button>
+      )}
     </main>
   );
 }
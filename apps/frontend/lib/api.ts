@@ -37,6 +37,12 @@ export type SnsPost = {
   can_edit: boolean;
 };
 
+export type SnsPostPage = {
+  items: SnsPost[];
+  next_cursor: string | null;
+  prev_cursor: string | null;
+};
+
 export const authHeader = (token: string) => ({ Authorization: `Bearer ${token}` });
 
 
@@ -52,3 +58,21 @@ export type SnsComment = {
   updated_at: string;
   can_edit: boolean;
 };
+
+export type SnsCommentNode = SnsComment & {
+  replies: SnsCommentNode[];
+  reply_count: number;
+  has_more_replies: boolean;
+  next_reply_cursor: string | null;
+};
+
+export type SnsPostDetail = {
+  post: SnsPost;
+  threads: SnsCommentNode[];
+  next_cursor: string | null;
+};
+
+export type SnsCommentPage = {
+  items: SnsComment[];
+  next_cursor: string | null;
+};
@@ -2,18 +2,64 @@ import hashlib
 import json
 import os
 import re
-import urllib.error
+import time
 import urllib.parse
-import urllib.request
 
+from http_client import HTTPClientError, request_json
 from prompt_templates import render_prompt
+from rate_limit import AI_RATE_LIMIT_DEFAULT_BACKOFF_SECONDS, ProviderRateLimiter, get_rate_limiter
+
+MOCK_AI_LATENCY_SECONDS = float(os.getenv("MOCK_AI_LATENCY_SECONDS", "0"))
 
 
 class AIProviderError(Exception):
     pass
 
 
+class AIProviderClientError(AIProviderError):
+    pass
+
+
+class AIProviderRateLimitError(AIProviderError):
+    def __init__(self, message: str, retry_after: float) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def _send_json(
+    url: str,
+    body: dict,
+    headers: dict[str, str],
+    provider_name: str,
+    limiter: ProviderRateLimiter,
+) -> dict:
+    with limiter.slot():
+        try:
+            resp = request_json("POST", url, body=body, headers=headers)
+        except HTTPClientError as exc:
+            raise AIProviderError(f"{provider_name} request failed: {exc}") from exc
+
+        wait = limiter.observe(resp.headers)
+        if resp.status == 429:
+            if wait is None:
+                wait = AI_RATE_LIMIT_DEFAULT_BACKOFF_SECONDS
+                limiter.backoff(wait)
+            raise AIProviderRateLimitError(f"{provider_name} rate limited: HTTP {resp.status}", retry_after=wait)
+        if resp.status >= 500:
+            raise AIProviderError(f"{provider_name} request failed: HTTP {resp.status} {resp.reason}")
+        if resp.status >= 400:
+            raise AIProviderClientError(f"{provider_name} request failed: HTTP {resp.status} {resp.reason}")
+
+        try:
+            return json.loads(resp.data.decode("utf-8"))
+        except ValueError as exc:
+            raise AIProviderError(f"{provider_name} response parse failed") from exc
+
+
 class AIProvider:
+    name = "mock"
+    model = "mock"
+
     def generate_post(
         self,
         persona: str,
@@ -44,6 +90,13 @@ class MockAIProvider(AIProvider):
         "유머": ["밈", "웃김", "드립", "반전", "썰"],
     }
 
+    def __init__(self, latency_seconds: float | None = None) -> None:
+        self.latency_seconds = MOCK_AI_LATENCY_SECONDS if latency_seconds is None else latency_seconds
+
+    def _simulate_latency(self) -> None:
+        if self.latency_seconds > 0:
+            time.sleep(self.latency_seconds)
+
     def _seed(self, *parts: str) -> int:
         raw = "|".join(parts)
         return int(hashlib.sha256(raw.encode("utf-8")).hexdigest()[:8], 16)
@@ -67,6 +120,7 @@ class MockAIProvider(AIProvider):
         tone: str,
         recent_posts: list[str] | None = None,
     ) -> str:
+        self._simulate_latency()
         recent_posts = recent_posts or []
         seed = self._seed(persona, topic, category, tone, "|".join(recent_posts[-3:]))
         keyword = self._pick(self.CATEGORY_KEYWORDS.get(category, [topic]), seed)
@@ -104,6 +158,7 @@ class MockAIProvider(AIProvider):
         tone: str,
         recent_comments: list[str] | None = None,
     ) -> str:
+        self._simulate_latency()
         recent_comments = recent_comments or []
         keyword = self._extract_keyword(f"{post_title} {post_content} {post_category}")
         seed = self._seed(persona, post_title, post_category, post_content, tone, "|".join(recent_comments[-3:]))
@@ -128,9 +183,12 @@ class MockAIProvider(AIProvider):
 
 
 class OpenAIProvider(AIProvider):
+    name = "gpt"
+
     def __init__(self, api_key: str, model: str) -> None:
         self.api_key = api_key
         self.model = model
+        self.limiter = get_rate_limiter("gpt", api_key)
 
     def _request(self, prompt: str) -> str:
         body = {
@@ -139,22 +197,17 @@ class OpenAIProvider(AIProvider):
             "max_output_tokens": 220,
             "temperature": 0.9,
         }
-        req = urllib.request.Request(
-            url="https://api.openai.com/v1/responses",
-            method="POST",
-            data=json.dumps(body).encode("utf-8"),
-            headers={
+        payload = _send_json(
+            "https://api.openai.com/v1/responses",
+            body,
+            {
                 "Authorization": f"Bearer {self.api_key}",
                 "Content-Type": "application/json",
             },
+            "openai",
+            self.limiter,
         )
 
-        try:
-            with urllib.request.urlopen(req, timeout=20) as resp:
-                payload = json.loads(resp.read().decode("utf-8"))
-        except urllib.error.URLError as exc:
-            raise AIProviderError(f"openai request failed: {exc}") from exc
-
         text = payload.get("output_text")
         if text:
             return text.strip()
@@ -196,9 +249,12 @@ class OpenAIProvider(AIProvider):
 
 
 class GeminiProvider(AIProvider):
+    name = "gemini"
+
     def __init__(self, api_key: str, model: str) -> None:
         self.api_key = api_key
         self.model = model
+        self.limiter = get_rate_limiter("gemini", api_key)
 
     def _request(self, prompt: str) -> str:
         body = {
@@ -206,13 +262,7 @@ class GeminiProvider(AIProvider):
             "generationConfig": {"temperature": 0.9, "maxOutputTokens": 220},
         }
         url = f"https://generativelanguage.googleapis.com/v1beta/models/{urllib.parse.quote(self.model)}:generateContent?key={urllib.parse.quote(self.api_key)}"
-        req = urllib.request.Request(url=url, method="POST", data=json.dumps(body).encode("utf-8"), headers={"Content-Type": "application/json"})
-
-        try:
-            with urllib.request.urlopen(req, timeout=20) as resp:
-                payload = json.loads(resp.read().decode("utf-8"))
-        except urllib.error.URLError as exc:
-            raise AIProviderError(f"gemini request failed: {exc}") from exc
+        payload = _send_json(url, body, {"Content-Type": "application/json"}, "gemini", self.limiter)
 
         candidates = payload.get("candidates", [])
         if candidates:
@@ -251,9 +301,12 @@ class GeminiProvider(AIProvider):
 
 
 class ClaudeProvider(AIProvider):
+    name = "claude"
+
     def __init__(self, api_key: str, model: str) -> None:
         self.api_key = api_key
         self.model = model
+        self.limiter = get_rate_limiter("claude", api_key)
 
     def _request(self, prompt: str) -> str:
         body = {
@@ -262,23 +315,18 @@ class ClaudeProvider(AIProvider):
             "temperature": 0.9,
             "messages": [{"role": "user", "content": prompt}],
         }
-        req = urllib.request.Request(
-            url="https://api.anthropic.com/v1/messages",
-            method="POST",
-            data=json.dumps(body).encode("utf-8"),
-            headers={
+        payload = _send_json(
+            "https://api.anthropic.com/v1/messages",
+            body,
+            {
                 "x-api-key": self.api_key,
                 "anthropic-version": "2023-06-01",
                 "content-type": "application/json",
             },
+            "claude",
+            self.limiter,
         )
 
-        try:
-            with urllib.request.urlopen(req, timeout=20) as resp:
-                payload = json.loads(resp.read().decode("utf-8"))
-        except urllib.error.URLError as exc:
-            raise AIProviderError(f"claude request failed: {exc}") from exc
-
         for item in payload.get("content", []):
             if item.get("type") == "text":
                 text = item.get("text", "").strip()
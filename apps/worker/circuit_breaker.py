@@ -0,0 +1,77 @@
+import os
+import threading
+import time
+
+AI_CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("AI_CIRCUIT_FAILURE_THRESHOLD", "5"))
+AI_CIRCUIT_OPEN_SECONDS = float(os.getenv("AI_CIRCUIT_OPEN_SECONDS", "60"))
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    def __init__(self, name: str, failure_threshold: int, open_seconds: float) -> None:
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.open_seconds = max(0.0, open_seconds)
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probe_started_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            now = time.monotonic()
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN and now - self.opened_at < self.open_seconds:
+                return False
+            if self.state == HALF_OPEN and now - self.probe_started_at < self.open_seconds:
+                return False
+            self.state = HALF_OPEN
+            self.probe_started_at = now
+            return True
+
+    def retry_after(self) -> float:
+        with self._lock:
+            if self.state == CLOSED:
+                return 0.0
+            started = self.opened_at if self.state == OPEN else self.probe_started_at
+            return max(0.0, self.open_seconds - (time.monotonic() - started))
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self.state != CLOSED:
+                print(f"[worker] circuit closed name={self.name}", flush=True)
+            self.state = CLOSED
+            self.failures = 0
+
+    def release_probe(self) -> None:
+        with self._lock:
+            if self.state == HALF_OPEN:
+                self.probe_started_at = 0.0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != OPEN:
+                    print(f"[worker] circuit opened name={self.name} failures={self.failures}", flush=True)
+                self.state = OPEN
+                self.opened_at = time.monotonic()
+
+
+_breakers: dict[tuple[str, str], CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(provider: str, model: str) -> CircuitBreaker:
+    key = (provider, model)
+    with _breakers_lock:
+        breaker = _breakers.get(key)
+        if breaker is None:
+            breaker = CircuitBreaker(f"{provider}/{model}", AI_CIRCUIT_FAILURE_THRESHOLD, AI_CIRCUIT_OPEN_SECONDS)
+            _breakers[key] = breaker
+        return breaker
@@ -0,0 +1,38 @@
+import json
+import os
+from collections.abc import Mapping
+
+import urllib3
+
+AI_HTTP_POOL_SIZE = int(os.getenv("AI_HTTP_POOL_SIZE", "10"))
+AI_HTTP_CONNECT_TIMEOUT_SECONDS = float(os.getenv("AI_HTTP_CONNECT_TIMEOUT_SECONDS", "5"))
+AI_HTTP_READ_TIMEOUT_SECONDS = float(os.getenv("AI_HTTP_READ_TIMEOUT_SECONDS", "20"))
+
+
+class HTTPClientError(Exception):
+    pass
+
+
+http = urllib3.PoolManager(
+    num_pools=16,
+    maxsize=AI_HTTP_POOL_SIZE,
+    timeout=urllib3.Timeout(connect=AI_HTTP_CONNECT_TIMEOUT_SECONDS, read=AI_HTTP_READ_TIMEOUT_SECONDS),
+    retries=False,
+)
+
+
+def request_json(
+    method: str,
+    url: str,
+    body: dict | None = None,
+    headers: Mapping[str, str] | None = None,
+) -> urllib3.BaseHTTPResponse:
+    try:
+        return http.request(
+            method,
+            url,
+            body=json.dumps(body).encode("utf-8") if body is not None else None,
+            headers=dict(headers or {}),
+        )
+    except urllib3.exceptions.HTTPError as exc:
+        raise HTTPClientError(str(exc)) from exc
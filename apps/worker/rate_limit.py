@@ -0,0 +1,181 @@
+import hashlib
+import os
+import threading
+import time
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+
+AI_RATE_LIMIT_PER_MINUTE = float(os.getenv("AI_RATE_LIMIT_PER_MINUTE", "60"))
+AI_RATE_LIMIT_BURST = int(os.getenv("AI_RATE_LIMIT_BURST", "5"))
+AI_MAX_CONCURRENCY_PER_KEY = int(os.getenv("AI_MAX_CONCURRENCY_PER_KEY", "4"))
+AI_RATE_LIMIT_DEFAULT_BACKOFF_SECONDS = float(os.getenv("AI_RATE_LIMIT_DEFAULT_BACKOFF_SECONDS", "5"))
+AI_RATE_LIMIT_SWEEP_SECONDS = float(os.getenv("AI_RATE_LIMIT_SWEEP_SECONDS", "60"))
+
+
+def _provider_setting(name: str, provider: str, default: float) -> float:
+    return float(os.getenv(f"{name}_{provider.upper()}", str(default)))
+
+
+class TokenBucket:
+    def __init__(self, rate_per_second: float, capacity: int) -> None:
+        self.rate_per_second = max(rate_per_second, 0.001)
+        self.capacity = max(1, capacity)
+        self.tokens = float(self.capacity)
+        self.updated_at = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate_per_second)
+                self.updated_at = now
+                if now < self.blocked_until:
+                    wait = self.blocked_until - now
+                elif self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                else:
+                    wait = (1 - self.tokens) / self.rate_per_second
+            time.sleep(wait)
+
+    def is_full(self, now: float) -> bool:
+        with self._lock:
+            if now < self.blocked_until:
+                return False
+            return self.tokens + (now - self.updated_at) * self.rate_per_second >= self.capacity
+
+    def pause(self, seconds: float) -> None:
+        if seconds <= 0:
+            return
+        with self._lock:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+            self.tokens = 0.0
+
+
+class ProviderRateLimiter:
+    def __init__(self, provider: str) -> None:
+        per_minute = _provider_setting("AI_RATE_LIMIT_PER_MINUTE", provider, AI_RATE_LIMIT_PER_MINUTE)
+        burst = int(_provider_setting("AI_RATE_LIMIT_BURST", provider, AI_RATE_LIMIT_BURST))
+        concurrency = int(_provider_setting("AI_MAX_CONCURRENCY_PER_KEY", provider, AI_MAX_CONCURRENCY_PER_KEY))
+        self.provider = provider
+        self.bucket = TokenBucket(per_minute / 60.0, burst)
+        self.semaphore = threading.BoundedSemaphore(max(1, concurrency))
+        self.in_use = 0
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        with self._lock:
+            self.in_use += 1
+        try:
+            with self.semaphore:
+                self.bucket.acquire()
+                yield
+        finally:
+            with self._lock:
+                self.in_use -= 1
+
+    def is_idle(self, now: float) -> bool:
+        with self._lock:
+            if self.in_use:
+                return False
+        return self.bucket.is_full(now)
+
+    def backoff(self, seconds: float) -> None:
+        self.bucket.pause(seconds)
+
+    def observe(self, headers: Mapping[str, str] | None) -> float | None:
+        wait = parse_rate_limit_wait(headers)
+        if wait is not None:
+            self.backoff(wait)
+        return wait
+
+
+def _parse_duration(value: str) -> float | None:
+    value = value.strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+
+    total = 0.0
+    number = ""
+    index = 0
+    units = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 0.001}
+    while index < len(value):
+        char = value[index]
+        if char.isdigit() or char == ".":
+            number += char
+            index += 1
+            continue
+        unit = "ms" if value.startswith("ms", index) else char
+        if unit not in units or not number:
+            return None
+        total += float(number) * units[unit]
+        number = ""
+        index += len(unit)
+    return total if not number else None
+
+
+def _parse_reset_at(value: str) -> float | None:
+    try:
+        reset_at = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        try:
+            reset_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+    if reset_at.tzinfo is None:
+        reset_at = reset_at.replace(tzinfo=UTC)
+    return max(0.0, (reset_at - datetime.now(UTC)).total_seconds())
+
+
+def parse_rate_limit_wait(headers: Mapping[str, str] | None) -> float | None:
+    if not headers:
+        return None
+
+    retry_after = headers.get("retry-after")
+    if retry_after:
+        seconds = _parse_duration(retry_after)
+        return seconds if seconds is not None else _parse_reset_at(retry_after)
+
+    remaining = headers.get("x-ratelimit-remaining-requests")
+    reset = headers.get("x-ratelimit-reset-requests")
+    if remaining is not None and reset and remaining.strip() == "0":
+        return _parse_duration(reset)
+
+    remaining = headers.get("anthropic-ratelimit-requests-remaining")
+    reset = headers.get("anthropic-ratelimit-requests-reset")
+    if remaining is not None and reset and remaining.strip() == "0":
+        return _parse_reset_at(reset)
+
+    return None
+
+
+_limiters: dict[tuple[str, str], ProviderRateLimiter] = {}
+_limiters_lock = threading.Lock()
+_limiters_swept_at = time.monotonic()
+
+
+def _sweep_idle_limiters(now: float) -> None:
+    global _limiters_swept_at
+    if now - _limiters_swept_at < AI_RATE_LIMIT_SWEEP_SECONDS:
+        return
+    _limiters_swept_at = now
+    for key in [key for key, limiter in _limiters.items() if limiter.is_idle(now)]:
+        del _limiters[key]
+
+
+def get_rate_limiter(provider: str, api_key: str) -> ProviderRateLimiter:
+    key = (provider, hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16])
+    with _limiters_lock:
+        _sweep_idle_limiters(time.monotonic())
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = ProviderRateLimiter(provider)
+            _limiters[key] = limiter
+        return limiter
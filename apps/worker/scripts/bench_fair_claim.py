@@ -0,0 +1,99 @@
+"""선점 순서에 따른 테넌트별 지연 시뮬레이션.
+
+한 사용자가 대량의 작업을 한꺼번에 쌓은 상태에서 다른 사용자들의 작업이 조금씩 도착할 때,
+`next_run_at` 순서(기존)와 사용자별 라운드로빈 순서(`claim_due_jobs`)로 배치를 선점했을 때의
+사용자별 대기 시간(선점 시각 - next_run_at)을 비교한다. DB 없이 SQL 정렬 규칙만 재현한다.
+
+    python scripts/bench_fair_claim.py --heavy-jobs 3000 --tenants 50 --jobs-per-tenant 5 --batch 10
+"""
+
+import argparse
+import random
+import statistics
+from collections import defaultdict
+
+
+def claim_fifo(due: list[dict], batch_size: int) -> list[dict]:
+    return sorted(due, key=lambda job: (-job["priority"], job["next_run_at"], job["id"]))[:batch_size]
+
+
+def claim_fair(due: list[dict], batch_size: int) -> list[dict]:
+    by_user: dict[int, list[dict]] = defaultdict(list)
+    for job in due:
+        by_user[job["user_id"]].append(job)
+
+    ranked = []
+    for jobs in by_user.values():
+        jobs.sort(key=lambda job: (-job["priority"], job["next_run_at"], job["id"]))
+        for turn, job in enumerate(jobs[:batch_size], start=1):
+            ranked.append((turn, -job["priority"], job["next_run_at"], job["id"], job))
+    ranked.sort(key=lambda row: row[:4])
+    return [row[-1] for row in ranked[:batch_size]]
+
+
+def build_jobs(args: argparse.Namespace) -> list[dict]:
+    rng = random.Random(args.seed)
+    jobs = [{"id": i, "user_id": 0, "priority": 0, "next_run_at": 0.0} for i in range(args.heavy_jobs)]
+    for tenant in range(1, args.tenants + 1):
+        for _ in range(args.jobs_per_tenant):
+            jobs.append(
+                {
+                    "id": len(jobs),
+                    "user_id": tenant,
+                    "priority": 0,
+                    "next_run_at": rng.uniform(0, args.arrival_window),
+                }
+            )
+    return jobs
+
+
+def simulate(jobs: list[dict], claim, batch_size: int, tick: float) -> dict[int, list[float]]:
+    pending = sorted(jobs, key=lambda job: job["next_run_at"])
+    due: list[dict] = []
+    lags: dict[int, list[float]] = defaultdict(list)
+    now = 0.0
+    cursor = 0
+    while cursor < len(pending) or due:
+        while cursor < len(pending) and pending[cursor]["next_run_at"] <= now:
+            due.append(pending[cursor])
+            cursor += 1
+        claimed = claim(due, batch_size)
+        claimed_ids = {job["id"] for job in claimed}
+        due = [job for job in due if job["id"] not in claimed_ids]
+        for job in claimed:
+            lags[job["user_id"]].append(now - job["next_run_at"])
+        now += tick
+    return lags
+
+
+def summarize(name: str, lags: dict[int, list[float]]) -> None:
+    heavy = sorted(lags.get(0, []))
+    light = sorted(lag for user_id, values in lags.items() if user_id != 0 for lag in values)
+    for label, values in (("heavy", heavy), ("others", light)):
+        if not values:
+            continue
+        p95 = values[max(0, int(len(values) * 0.95) - 1)]
+        print(
+            f"{name:5s} {label:6s} jobs={len(values):5d} p50={statistics.median(values):7.1f}s "
+            f"p95={p95:7.1f}s max={values[-1]:7.1f}s"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--heavy-jobs", type=int, default=3000)
+    parser.add_argument("--tenants", type=int, default=50)
+    parser.add_argument("--jobs-per-tenant", type=int, default=5)
+    parser.add_argument("--arrival-window", type=float, default=300.0)
+    parser.add_argument("--batch", type=int, default=10)
+    parser.add_argument("--tick", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    jobs = build_jobs(args)
+    summarize("fifo", simulate(jobs, claim_fifo, args.batch, args.tick))
+    summarize("fair", simulate(jobs, claim_fair, args.batch, args.tick))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""AI Provider HTTP 호출 keep-alive 벤치마크.
+
+로컬 스텁 서버(HTTP/1.1)를 띄우고 새 연결마다 `--handshake` 만큼 지연을 넣어
+TLS 핸드셰이크 비용을 흉내 낸 뒤, 요청마다 연결을 새로 여는 `urllib.request`와
+`http_client.http`(연결 풀 재사용)의 호출당 지연을 비교한다.
+
+    python scripts/bench_http_keepalive.py --requests 200 --handshake 0.02
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from http_client import request_json  # noqa: E402
+
+RESPONSE = json.dumps({"output_text": "ok"}).encode("utf-8")
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    handshake_seconds = 0.0
+
+    def setup(self) -> None:
+        time.sleep(self.handshake_seconds)
+        super().setup()
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length", "0"))
+        self.rfile.read(length)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(RESPONSE)))
+        self.end_headers()
+        self.wfile.write(RESPONSE)
+
+    def log_message(self, format: str, *args) -> None:
+        return None
+
+
+def call_urlopen(url: str) -> None:
+    req = urllib.request.Request(
+        url=url,
+        method="POST",
+        data=json.dumps({"input": "hi"}).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+    )
+    with urllib.request.urlopen(req, timeout=20) as resp:
+        json.loads(resp.read().decode("utf-8"))
+
+
+def call_pooled(url: str) -> None:
+    resp = request_json("POST", url, body={"input": "hi"}, headers={"Content-Type": "application/json"})
+    json.loads(resp.data.decode("utf-8"))
+
+
+def measure(name: str, call, url: str, count: int) -> None:
+    samples = []
+    for _ in range(count):
+        started = time.perf_counter()
+        call(url)
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    p50 = statistics.median(samples)
+    p95 = samples[int(len(samples) * 0.95) - 1]
+    print(f"{name:8s} requests={count} p50={p50:6.2f}ms p95={p95:6.2f}ms total={sum(samples) / 1000:6.2f}s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--handshake", type=float, default=0.02)
+    args = parser.parse_args()
+
+    StubHandler.handshake_seconds = args.handshake
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/v1/responses"
+
+    try:
+        measure("urlopen", call_urlopen, url, args.requests)
+        measure("pooled", call_pooled, url, args.requests)
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""워커 동시 실행 처리량 벤치마크.
+
+DB 접근은 메모리 가짜 연결로 대체하고, `MockAIProvider`에 지연을 주입해
+동시 실행 수(`WORKER_CONCURRENCY`)에 따른 `run_job` 처리량과 동시에 빌린 DB 연결 최대 수를 비교한다.
+
+    python scripts/bench_worker_concurrency.py --jobs 200 --latency 0.05 --concurrency 1 4 16 32
+"""
+
+import argparse
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import worker  # noqa: E402
+from ai_provider import MockAIProvider  # noqa: E402
+
+
+class FakeCursor:
+    rowcount = 1
+
+    def __enter__(self) -> "FakeCursor":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+    def execute(self, query: str, params: tuple | None = None) -> None:
+        return None
+
+    def fetchone(self) -> dict:
+        return {"id": 1}
+
+
+class FakeConnection:
+    def cursor(self) -> FakeCursor:
+        return FakeCursor()
+
+    @contextmanager
+    def transaction(self):
+        yield
+
+
+class ConnectionUsage:
+    def __init__(self) -> None:
+        self.in_use = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.in_use = 0
+            self.peak = 0
+
+    @contextmanager
+    def connection(self):
+        with self._lock:
+            self.in_use += 1
+            self.peak = max(self.peak, self.in_use)
+        try:
+            yield FakeConnection()
+        finally:
+            with self._lock:
+                self.in_use -= 1
+
+
+usage = ConnectionUsage()
+
+
+def install_fakes(latency: float) -> dict:
+    bot = {
+        "id": 1,
+        "user_id": 1,
+        "name": "bench",
+        "persona": "벤치마크 봇",
+        "topic": "경제 뉴스",
+        "ai_provider": "mock",
+        "api_key": "",
+        "ai_model": "mock-v1",
+    }
+
+    worker.get_connection = usage.connection
+    worker.get_provider = lambda *args: MockAIProvider(latency_seconds=latency)
+    return {
+        "bot": bot,
+        "has_post_today": False,
+        "recent_posts": [],
+        "recent_comments": [],
+        "reply_target": None,
+        "post_target": None,
+    }
+
+
+def run(concurrency: int, jobs: list[dict], context: dict) -> float:
+    usage.reset()
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        processed = sum(executor.map(lambda job: worker.run_job(job, context), jobs))
+    elapsed = time.perf_counter() - started
+    assert processed == len(jobs)
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--jobs", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16, 32])
+    args = parser.parse_args()
+
+    context = install_fakes(args.latency)
+    jobs = [
+        {"id": i, "bot_id": 1, "job_type": "ai_create_post", "payload": {}, "retry_count": 0, "max_retries": 3}
+        for i in range(args.jobs)
+    ]
+
+    for concurrency in args.concurrency:
+        elapsed = run(concurrency, jobs, context)
+        print(
+            f"concurrency={concurrency:3d} jobs={args.jobs} elapsed={elapsed:6.2f}s "
+            f"jobs/s={args.jobs / elapsed:8.1f} peak_connections={usage.peak}"
+        )
+
+
+if __name__ == "__main__":
+    main()